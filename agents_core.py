@@ -8,16 +8,26 @@ Design: keep minimal and testable. Redis is used for production memory; a simple
 is provided for tests/local use.
 """
 from __future__ import annotations
-from typing import Any, Dict, Optional, Protocol, List
+from typing import Any, Dict, Iterable, Iterator, Optional, Protocol, List, Tuple, Union
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import asyncio
+import contextlib
+import inspect
 import os
+import time
 import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
 class Tool(Protocol):
+    """A tool exposes `run`; it may be a coroutine function for natively async tools."""
+
     def run(self, *args, **kwargs) -> Any:  # pragma: no cover - protocol
         ...
 
@@ -33,10 +43,32 @@ class ToolRegistry:
         return self._tools[name]
 
 
+@dataclass(slots=True)
+class ToolCall:
+    """A planned action: one slotted object instead of a {"tool", "args", "kwargs"} dict.
+
+    `plan` may return either form; `stop=True` marks the finish sentinel. Compared by value but,
+    like the dict it replaces, not hashable (`kwargs` is a dict).
+    """
+    tool: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    stop: bool = False
+
+
+Action = Union[ToolCall, Dict[str, Any]]
+
+
+def _unpack_action(action: Action) -> Tuple[str, Any, Dict[str, Any]]:
+    if isinstance(action, ToolCall):
+        return action.tool, action.args, action.kwargs
+    return action.get("tool"), action.get("args", []), action.get("kwargs", {})
+
+
 # --- Memory interface ---
 
 class Memory(Protocol):
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         ...
 
     def get(self, key: str) -> Optional[Any]:
@@ -45,6 +77,9 @@ class Memory(Protocol):
     def append_to_list(self, key: str, value: Any) -> None:
         ...
 
+    def append_many(self, key: str, values: Iterable[Any]) -> None:
+        ...
+
     def get_list(self, key: str) -> List[Any]:
         ...
 
@@ -54,20 +89,43 @@ class InMemoryMemory:
 
     def __init__(self):
         self._store: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        # lists live apart from plain values (as in Redis); deques append without reallocating
+        self._lists: defaultdict[str, deque] = defaultdict(deque)
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         self._store[key] = value
+        if ttl:
+            self._expires[key] = time.monotonic() + ttl
+        else:
+            self._expires.pop(key, None)
 
     def get(self, key: str) -> Optional[Any]:
+        expires = self._expires.get(key)
+        if expires is not None and time.monotonic() >= expires:
+            del self._expires[key]
+            self._store.pop(key, None)
+            return None
         return self._store.get(key)
 
     def append_to_list(self, key: str, value: Any) -> None:
-        lst = self._store.get(key) or []
-        lst.append(value)
-        self._store[key] = lst
+        self._lists[key].append(value)
+
+    def append_many(self, key: str, values: Iterable[Any]) -> None:
+        self._lists[key].extend(values)
 
     def get_list(self, key: str) -> List[Any]:
-        return list(self._store.get(key) or [])
+        # a copy, so callers may mutate it; use `iter_list` to just read
+        lst = self._lists.get(key)
+        return list(lst) if lst else []
+
+    def iter_list(self, key: str) -> Iterator[Any]:
+        """Iterate a list without copying it; do not append to `key` while iterating."""
+        return iter(self._lists.get(key, ()))
+
+    def batch(self) -> contextlib.AbstractContextManager:
+        # writes are already in-process; provided so callers can batch against either backend
+        return contextlib.nullcontext()
 
 
 # Attempt to import redis at module level so tests can monkeypatch `agents_core.redis`
@@ -76,12 +134,44 @@ try:
 except Exception:
     redis = None
 
+# Prefer orjson (C/Rust codec) for Redis payloads; fall back to the stdlib json module
+try:
+    import orjson
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+except Exception:
+    orjson = None
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Connection pools shared by every RedisMemory pointing at the same URL, so building memory
+# repeatedly (team run + PersonalResearcher) reuses sockets instead of reconnecting/re-AUTHing.
+_POOLS: Dict[str, Any] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool(redis_url: str):
+    with _POOL_LOCK:
+        pool = _POOLS.get(redis_url)
+        if pool is None:
+            pool = redis.ConnectionPool.from_url(
+                redis_url,
+                decode_responses=True,
+                max_connections=int(os.environ.get("REDIS_MAX_CONN", "50")),
+            )
+            _POOLS[redis_url] = pool
+        return pool
+
 
 class RedisMemory:
     """Redis-based memory implementation. Requires `redis` package.
 
     Configuration:
       - REDIS_URL env var (e.g., redis://localhost:6379/0)
+      - REDIS_MAX_CONN env var: size cap of the per-URL shared connection pool (default 50)
 
     Use `InMemoryMemory` in tests if you don't have Redis available.
     """
@@ -91,32 +181,67 @@ class RedisMemory:
         if redis is None:  # pragma: no cover - platform deps
             raise RuntimeError("`redis` package required for RedisMemory")
 
-        self._client = redis.from_url(redis_url, decode_responses=True)
+        self._client = redis.Redis(connection_pool=_get_pool(redis_url))
+        # per-thread pipeline of an open `batch()`; writes are queued on it instead of sent
+        self._local = threading.local()
+
+    def close(self) -> None:
+        """Release this client; the shared pool stays open for other instances."""
+        self._client.close()
 
-    def set(self, key: str, value: Any) -> None:
-        self._client.set(key, json.dumps(value))
+    def _writer(self) -> Any:
+        return getattr(self._local, "pipe", None) or self._client
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self._writer().set(key, _dumps(value), ex=ttl or None)
+
+    @staticmethod
+    def _decode(v: Any) -> Any:
+        try:
+            return _loads(v)
+        except Exception:
+            return v
+
+    @contextlib.contextmanager
+    def pipeline(self) -> Iterator[Any]:
+        """Queue commands on a non-transactional pipeline; they are sent in one round-trip on exit."""
+        pipe = self._client.pipeline(transaction=False)
+        yield pipe
+        pipe.execute()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer `set`/`append_to_list`/`append_many` calls made on this thread; they are sent
+        in one round-trip on exit. Reads inside the block do not see the buffered writes.
+        """
+        if getattr(self._local, "pipe", None) is not None:
+            # nested: the outermost batch flushes
+            yield
+            return
+        with self.pipeline() as pipe:
+            self._local.pipe = pipe
+            try:
+                yield
+            finally:
+                self._local.pipe = None
 
     def get(self, key: str) -> Optional[Any]:
         v = self._client.get(key)
         if v is None:
             return None
-        try:
-            return json.loads(v)
-        except Exception:
-            return v
+        return self._decode(v)
 
     def append_to_list(self, key: str, value: Any) -> None:
-        self._client.rpush(key, json.dumps(value))
+        self._writer().rpush(key, _dumps(value))
+
+    def append_many(self, key: str, values: Iterable[Any]) -> None:
+        with self.batch():
+            pipe = self._local.pipe
+            for v in values:
+                pipe.rpush(key, _dumps(v))
 
     def get_list(self, key: str) -> List[Any]:
-        vals = self._client.lrange(key, 0, -1)
-        out: List[Any] = []
-        for v in vals:
-            try:
-                out.append(json.loads(v))
-            except Exception:
-                out.append(v)
-        return out
+        return [self._decode(v) for v in self._client.lrange(key, 0, -1)]
 
 
 # --- Agent base (reasoning loop) ---
@@ -129,23 +254,30 @@ class Agent:
       - act: execute an action using tools
       - observe: process tool results
       - reflect: update memory or internal state
+
+    Actions returned by `plan` are independent and executed concurrently on a thread pool
+    bounded by `max_workers` (default: TOOL_CONCURRENCY_LIMIT env var, 8). Results are
+    observed/reflected on the calling thread in plan order. A limit of 1 runs sequentially.
     """
 
-    def __init__(self, name: str, tools: ToolRegistry, memory: Optional[Memory] = None):
+    def __init__(self, name: str, tools: ToolRegistry, memory: Optional[Memory] = None, max_workers: Optional[int] = None):
         self.name = name
         self.tools = tools
         self.memory = memory or InMemoryMemory()
         self.history_key = f"agent:{self.name}:history"
-
-    def plan(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Return a list of actions. Action is a dict with 'tool' and 'args'"""
+        # observations buffered by `reflect` during a run, flushed with one `append_many`
+        self._history_buffer: Optional[List[Dict[str, Any]]] = None
+        self.max_workers = max(1, max_workers or int(os.environ.get("TOOL_CONCURRENCY_LIMIT", "8")))
+        # threads are spawned lazily by the executor, so an idle agent costs nothing
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+
+    def plan(self, context: Dict[str, Any]) -> List[Action]:
+        """Return a list of actions: `ToolCall`s or dicts with 'tool', 'args' and 'kwargs'"""
         raise NotImplementedError
 
-    def act(self, action: Dict[str, Any]) -> Any:
-        tool_name = action.get("tool")
+    def act(self, action: Action) -> Any:
+        tool_name, args, kwargs = _unpack_action(action)
         tool = self.tools.get(tool_name)
-        args = action.get("args", [])
-        kwargs = action.get("kwargs", {})
         logger.info("Agent %s invoking tool %s", self.name, tool_name)
         return tool.run(*args, **kwargs)
 
@@ -155,19 +287,76 @@ class Agent:
         return {"result": result}
 
     def reflect(self, observation: Dict[str, Any]) -> None:
-        # append to history
-        self.memory.append_to_list(self.history_key, observation)
-
-    def run_once(self, context: Dict[str, Any]) -> Any:
-        actions = self.plan(context)
+        # append to history (buffered while inside run_once, written directly otherwise)
+        if self._history_buffer is not None:
+            self._history_buffer.append(observation)
+        else:
+            self.memory.append_to_list(self.history_key, observation)
+
+    def _record(self, outputs: Iterable[Any]) -> List[Any]:
+        """Observe/reflect each tool result in order, then flush history in a single batch."""
         results = []
-        for action in actions:
-            res = self.act(action)
-            obs = self.observe(res)
-            self.reflect(obs)
-            results.append(res)
+        self._history_buffer = []
+        try:
+            for res in outputs:
+                obs = self.observe(res)
+                self.reflect(obs)
+                results.append(res)
+        finally:
+            buffered, self._history_buffer = self._history_buffer, None
+            if buffered:
+                append_many = getattr(self.memory, "append_many", None)
+                if append_many is not None:
+                    append_many(self.history_key, buffered)
+                else:
+                    for obs in buffered:
+                        self.memory.append_to_list(self.history_key, obs)
         return results
 
+    @staticmethod
+    def _truncate_at_stop(actions: List[Action]) -> List[Action]:
+        """Drop actions planned after the first one marked `stop=True` (finish sentinel)."""
+        for i, action in enumerate(actions):
+            if action.stop if isinstance(action, ToolCall) else action.get("stop"):
+                return actions[: i + 1]
+        return actions
+
+    def run_once(self, context: Dict[str, Any]) -> Any:
+        actions = self._truncate_at_stop(self.plan(context))
+        if self._pool is None or len(actions) <= 1:
+            outputs = (self.act(action) for action in actions)
+        else:
+            # fan out tool calls; observe/reflect stay on this thread so memory is mutated serially
+            futures = [self._pool.submit(self.act, action) for action in actions]
+            outputs = (f.result() for f in futures)
+        return self._record(outputs)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+class AsyncAgent(Agent):
+    """Agent variant whose tool calls are awaited concurrently with `asyncio.gather`.
+
+    Tools with an `async def run` are awaited directly; sync tools are offloaded to a worker
+    thread via `asyncio.to_thread` so blocking HTTP calls overlap instead of serializing.
+    """
+
+    async def act_async(self, action: Action) -> Any:
+        tool_name, args, kwargs = _unpack_action(action)
+        tool = self.tools.get(tool_name)
+        logger.info("Agent %s invoking tool %s (async)", self.name, tool_name)
+        if inspect.iscoroutinefunction(tool.run):
+            return await tool.run(*args, **kwargs)
+        return await asyncio.to_thread(tool.run, *args, **kwargs)
+
+    async def run_once_async(self, context: Dict[str, Any]) -> Any:
+        actions = self._truncate_at_stop(self.plan(context))
+        outputs = await asyncio.gather(*(self.act_async(action) for action in actions))
+        return self._record(outputs)
+
 
 # small utility: build memory from env
 
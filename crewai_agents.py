@@ -11,32 +11,178 @@ Design goals:
 - Easy to plug in a real Tavily client or use the included MockTavilyClient for testing
 """
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import List, Protocol, Optional, Dict, Tuple
+from dataclasses import dataclass, asdict, field
+from typing import Any, List, Protocol, Optional, Dict, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import re
+import asyncio
 import datetime
+import functools
+import hashlib
 import json
 import logging
 
-from crewai_agents_helpers import extract_entities
+import crewai_agents_helpers
+from agents_core import Memory
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Optional fuzzy matching backend (falls back to substring matching when absent)
+try:
+    from rapidfuzz import fuzz, process
+    _HAVE_FUZZ = True
+except Exception:
+    fuzz = process = None
+    _HAVE_FUZZ = False
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+# Precompiled patterns used by sentence splitting / claim normalization
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^a-z0-9 .,]")
+
+# Normalized claims shorter than this are treated as low-content and skipped
+_MIN_CLAIM_LEN = 40
+
+def _greedy_labels_loop(scores, threshold):
+    # labels[i] = index of the representative of claim i's cluster (i itself for a new cluster);
+    # a claim joins the earliest-created representative scoring >= threshold
+    n = scores.shape[0]
+    labels = np.empty(n, dtype=np.int64)
+    reps = np.empty(n, dtype=np.int64)
+    nreps = 0
+    for i in range(n):
+        labels[i] = i
+        for r in range(nreps):
+            if scores[i, reps[r]] >= threshold:
+                labels[i] = reps[r]
+                break
+        if labels[i] == i:
+            reps[nreps] = i
+            nreps += 1
+    return labels
+
+
+def _greedy_labels_np(scores, threshold):
+    n = scores.shape[0]
+    labels = np.arange(n, dtype=np.int64)
+    is_rep = np.zeros(n, dtype=bool)
+    for i in range(n):
+        # reps are created in index order, so the lowest matching rep index is the first cluster
+        hits = np.flatnonzero(is_rep[:i] & (scores[i, :i] >= threshold))
+        if hits.size:
+            labels[i] = hits[0]
+        else:
+            is_rep[i] = True
+    return labels
+
+
+# Below this many claims the numpy kernel is cheaper than importing numba and loading/compiling
+# the JIT kernel; the CLI's typical inputs (tens of claims) never touch numba
+_JIT_MIN_CLAIMS = 512
+
+# Lazily compiled numba kernel: _UNLOADED until first needed, None when numba is unavailable
+_UNLOADED = object()
+_jit_labels = _UNLOADED
+
+
+def _get_jit_labels():
+    global _jit_labels
+    if _jit_labels is _UNLOADED:
+        try:
+            from numba import njit
+            # cached on disk (cache=True), so only the first large run pays the compile cost
+            _jit_labels = njit(cache=True)(_greedy_labels_loop)
+        except Exception:
+            _jit_labels = None
+    return _jit_labels
+
+
+def _greedy_labels(scores, threshold):
+    if scores.shape[0] >= _JIT_MIN_CLAIMS:
+        kernel = _get_jit_labels()
+        if kernel is not None:
+            return kernel(scores, threshold)
+    return _greedy_labels_np(scores, threshold)
+
+# Above this many claims, `_cluster_claims` first splits them into MinHash/LSH buckets and only
+# scores pairs within a bucket (the dense score matrix grows as N^2)
+_LSH_MIN_CLAIMS = 512
+# 32 bands x 2 rows = 64 permutations. A pair at shingle Jaccard J becomes a candidate with
+# probability 1 - (1 - J**2)**32: ~0.95 at J=0.3, >0.99 from J=0.4, which covers pairs near the
+# default token_sort_ratio threshold of 80 (narrower bands would silently drop real merges)
+_LSH_BANDS, _LSH_ROWS = 32, 2
+_MERSENNE31 = (1 << 31) - 1
+
+
+def _lsh_text(text: str) -> str:
+    # the form `fuzz.token_sort_ratio` compares (tokens sorted), lowercased so case-only
+    # variants still collide; shingles of the raw text miss word-permuted duplicates
+    return " ".join(sorted(text.split())).lower()
+
+
+def _minhash_signatures(texts: Sequence[str]):
+    """(len(texts), bands * rows) MinHash signatures over character 3-gram shingles of the
+    token-sorted, lowercased texts."""
+    rng = np.random.default_rng(0)
+    n_perm = _LSH_BANDS * _LSH_ROWS
+    a = rng.integers(1, _MERSENNE31, n_perm, dtype=np.uint64)[:, None]
+    b = rng.integers(0, _MERSENNE31, n_perm, dtype=np.uint64)[:, None]
+    sigs = np.full((len(texts), n_perm), _MERSENNE31, dtype=np.uint64)
+    for i, text in enumerate(texts):
+        raw = np.frombuffer(_lsh_text(text).encode(), dtype=np.uint8).astype(np.uint64)
+        if raw.size < 3:
+            continue
+        # each 3-byte shingle packed into one integer (< 2**24, so a * x stays within uint64)
+        shingles = np.unique((raw[:-2] << 16) | (raw[1:-1] << 8) | raw[2:])
+        sigs[i] = ((a * shingles + b) % _MERSENNE31).min(axis=1)
+    return sigs
+
+
+def _lsh_components(texts: Sequence[str]) -> List[List[int]]:
+    """Group text indices that share at least one LSH band (transitively); groups are ascending."""
+    sigs = _minhash_signatures(texts)
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for band in range(_LSH_BANDS):
+        buckets: Dict[bytes, int] = {}
+        for i, key in enumerate(map(bytes, sigs[:, band * _LSH_ROWS:(band + 1) * _LSH_ROWS])):
+            j = buckets.setdefault(key, i)
+            if j != i:
+                parent[find(i)] = find(j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(texts)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
 # --- Models ---
+# Slotted (no per-instance __dict__) and immutable: many of these are created per run.
+# Unhashable fields are excluded from the generated __hash__.
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Source:
     title: str
     url: str
     snippet: str
     published: Optional[str] = None  # ISO date or free-form
-    metadata: Optional[Dict] = None
+    metadata: Optional[Dict] = field(default=None, compare=False, hash=False)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerifiedFact:
     claim: str
-    supporting_sources: List[Source]
+    supporting_sources: List[Source] = field(hash=False)
 
 # --- SearchTool protocol (Tavily interface adapter) ---
 
@@ -47,31 +193,41 @@ class SearchTool(Protocol):
 
 # --- Mock Tavily client for testing/demo ---
 
+_SAMPLE_TEMPLATES = (
+    "{topic} is primarily defined as an evolving area with multiple approaches.",
+    "Recent research on {topic} highlights three main trends: efficiency, scalability, and privacy.",
+    "Experts in {topic} recommend combining methods A and B for better results.",
+    "A 2023 survey on {topic} found that 70% of practitioners adopt hybrid techniques.",
+    "A study concluded that method X outperforms method Y on benchmarks for {topic}.",
+)
+_SAMPLE_DATES = tuple(datetime.date(2022 + i, 1, 1).isoformat() for i in range(3))
+
+
+@functools.lru_cache(maxsize=256)
+def _mock_source_fields(topic: str, limit: int) -> Tuple[Tuple[str, str, str, str, int], ...]:
+    # (title, url, snippet, published, rank) per result; immutable so it is safe to cache
+    snippets = [t.format(topic=topic) for t in _SAMPLE_TEMPLATES]
+    slug = topic.replace(" ", "_")
+    return tuple(
+        (f"{topic} - Article {i+1}", f"https://example.com/{slug}/{i+1}", snippets[i % len(snippets)], _SAMPLE_DATES[i % 3], i + 1)
+        for i in range(limit)
+    )
+
+
 class MockTavilyClient:
     """A simple mock search client that returns synthetic sources for a topic.
 
+    Results are deterministic, so the formatted fields are cached per (topic, limit); fresh
+    `Source` objects are still built on every call so callers never share mutable metadata.
+
     Replace or subclass with a real Tavily client implementing search(topic, limit).
     """
 
     def search(self, topic: str, limit: int = 10) -> List[Source]:
-        sample_snippets = [
-            f"{topic} is primarily defined as an evolving area with multiple approaches.",
-            f"Recent research on {topic} highlights three main trends: efficiency, scalability, and privacy.",
-            f"Experts in {topic} recommend combining methods A and B for better results.",
-            f"A 2023 survey on {topic} found that 70% of practitioners adopt hybrid techniques.",
-            f"A study concluded that method X outperforms method Y on benchmarks for {topic}.",
+        return [
+            Source(title=title, url=url, snippet=snippet, published=published, metadata={"rank": rank})
+            for title, url, snippet, published, rank in _mock_source_fields(topic, limit)
         ]
-        sources: List[Source] = []
-        for i in range(limit):
-            s = Source(
-                title=f"{topic} - Article {i+1}",
-                url=f"https://example.com/{topic.replace(' ', '_')}/{i+1}",
-                snippet=sample_snippets[i % len(sample_snippets)],
-                published=(datetime.date(2022 + (i % 3), 1, 1).isoformat()),
-                metadata={"rank": i + 1},
-            )
-            sources.append(s)
-        return sources
 
 # --- SeniorResearchAnalyst ---
 
@@ -85,112 +241,212 @@ class SeniorResearchAnalyst:
     - Attach supporting sources
 
     This ensures the writer consumes only verified facts.
+
+    If a `memory` backend is given, `verify_facts` results are memoized there, keyed on a hash of
+    the source urls/snippets and the verification parameters (optionally expiring after `cache_ttl` seconds).
     """
 
-    def __init__(self, search_tool: SearchTool, search_limit: int = 20, top_k: int = 10):
+    def __init__(self, search_tool: SearchTool, search_limit: int = 20, top_k: int = 10, memory: Optional[Memory] = None, cache_ttl: Optional[int] = None):
         self.search_tool = search_tool
         self.search_limit = search_limit
         self.top_k = top_k
+        self.memory = memory
+        self.cache_ttl = cache_ttl
 
-    def search_and_collect(self, topic: str) -> List[Source]:
-        logger.info("Searching for sources on topic: %s", topic)
-        sources = self.search_tool.search(topic, limit=self.search_limit)
+    def _select(self, sources: List[Source]) -> List[Source]:
         # simple ranking: keep top_k
         selected = sources[: self.top_k]
         logger.info("Collected %d sources", len(selected))
         return selected
 
+    def search_and_collect(self, topic: str) -> List[Source]:
+        logger.info("Searching for sources on topic: %s", topic)
+        return self._select(self.search_tool.search(topic, limit=self.search_limit))
+
     @staticmethod
     def _sentences_from_text(text: str) -> List[str]:
         # naive sentence split
-        sentences = re.split(r"(?<=[.!?])\s+", text.strip())
-        # filter tiny sentences
-        return [s.strip() for s in sentences if len(s.strip()) >= 20]
+        # filter tiny sentences (strip each piece once)
+        return [s for s in (t.strip() for t in _SENT_RE.split(text.strip())) if len(s) >= 20]
 
     @staticmethod
     def _normalize_claim(s: str) -> str:
         s2 = s.lower()
-        s2 = re.sub(r"\s+", " ", s2)
-        s2 = re.sub(r"[^a-z0-9 .,]", "", s2)
+        s2 = _WS_RE.sub(" ", s2)
+        s2 = _PUNCT_RE.sub("", s2)
         s2 = s2.strip()
         return s2
 
-    def verify_facts(self, sources: List[Source], min_support: int = 2, fuzzy_threshold: int = 80, ner_required: bool = False) -> List[VerifiedFact]:
+    @staticmethod
+    def _verify_cache_key(sources: List[Source], min_support: int, fuzzy_threshold: int, ner_required: bool) -> str:
+        # every Source field that ends up in the cached VerifiedFacts, plus the NER backend, so a
+        # changed title/date or a different spaCy model is never answered with stale results
+        h = hashlib.blake2b(digest_size=16)
+        for src in sources:
+            h.update(f"{src.url}\x1f{src.title or ''}\x1f{src.published or ''}\x1f{src.snippet or ''}\x1e".encode())
+        ner = crewai_agents_helpers.ner_backend_tag() if ner_required else ""
+        h.update(f"{min_support}:{fuzzy_threshold}:{int(ner_required)}:{ner}".encode())
+        return f"verify:{h.hexdigest()}"
+
+    @staticmethod
+    def _cluster_claims(claims: List[str], fuzzy_threshold: int) -> List[List[str]]:
+        """Greedily group claims: each claim joins the first earlier cluster whose representative
+        (first member) scores >= fuzzy_threshold, otherwise it starts a new cluster.
+
+        With rapidfuzz + numpy the full similarity matrix is computed once by `process.cdist`
+        (native, multi-threaded) and the greedy assignment reads from it (a Numba-compiled loop
+        at `_JIT_MIN_CLAIMS` claims or more when numba is installed), instead of calling the
+        scorer once per (claim, cluster) pair.
+        Beyond `_LSH_MIN_CLAIMS` claims, MinHash/LSH buckets are computed first and only pairs
+        within a bucket are scored.
+        """
+        clusters: List[List[str]] = []
+        if _HAVE_FUZZ and np is not None and len(claims) > _LSH_MIN_CLAIMS:
+            # Large inputs: pairs scoring >= the threshold share an LSH band with near certainty
+            # (see _LSH_BANDS), so each bucket is clustered on its own; ordering clusters by their
+            # first member reproduces the global greedy order. The pre-filter is probabilistic:
+            # a pair far below typical shingle overlap for its score can still be missed.
+            indexed: List[List[int]] = []
+            for comp in _lsh_components(claims):
+                for members in SeniorResearchAnalyst._greedy_clusters([claims[i] for i in comp], fuzzy_threshold):
+                    indexed.append([comp[m] for m in members])
+            indexed.sort(key=lambda members: members[0])
+            return [[claims[i] for i in members] for members in indexed]
+        if _HAVE_FUZZ and np is not None and len(claims) > 1:
+            return [[claims[i] for i in members] for members in SeniorResearchAnalyst._greedy_clusters(claims, fuzzy_threshold)]
+
+        for c in claims:
+            for members in clusters:
+                rep = members[0]
+                if _HAVE_FUZZ:
+                    # the cutoff lets rapidfuzz abandon a comparison once it can't reach the threshold
+                    sim = fuzz.token_sort_ratio(c, rep, score_cutoff=fuzzy_threshold)
+                else:
+                    # fallback to substring match
+                    sim = 100 if (c in rep or rep in c) else 0
+                if sim >= fuzzy_threshold:
+                    members.append(c)
+                    break
+            else:
+                clusters.append([c])
+        return clusters
+
+    @staticmethod
+    def _greedy_clusters(claims: List[str], fuzzy_threshold: int) -> List[List[int]]:
+        """Dense path of `_cluster_claims`: clusters as lists of claim indices, in creation order."""
+        if len(claims) == 1:
+            return [[0]]
+        scores = process.cdist(claims, claims, scorer=fuzz.token_sort_ratio, score_cutoff=fuzzy_threshold, workers=-1)
+        labels = _greedy_labels(scores, float(fuzzy_threshold))
+        clusters: List[List[int]] = []
+        cluster_of: Dict[int, List[int]] = {}  # rep index -> members
+        for i in range(len(claims)):
+            rep = int(labels[i])
+            if rep == i:
+                cluster_of[i] = [i]
+                clusters.append(cluster_of[i])
+            else:
+                cluster_of[rep].append(i)
+        return clusters
+
+    def verify_facts(self, sources: List[Source], min_support: int = 2, fuzzy_threshold: int = 80, ner_required: bool = False, entities: Optional[Dict[str, frozenset]] = None) -> List[VerifiedFact]:
+        """Return cross-source verified facts. `entities` optionally supplies precomputed
+        snippet -> entity sets (see `run_batch`); snippets missing from it are extracted here.
+        """
+        if self.memory is None:
+            return self._verify_facts(sources, min_support, fuzzy_threshold, ner_required, entities)
+
+        key = self._verify_cache_key(sources, min_support, fuzzy_threshold, ner_required)
+        try:
+            cached = self.memory.get(key)
+        except Exception as e:
+            logger.warning("verify_facts cache get failed: %s", e)
+            cached = None
+        if cached is not None:
+            logger.info("Verified facts served from cache (%d)", len(cached))
+            return [
+                VerifiedFact(claim=d["claim"], supporting_sources=[Source(**s) for s in d["supporting_sources"]])
+                for d in cached
+            ]
+
+        verified = self._verify_facts(sources, min_support, fuzzy_threshold, ner_required, entities)
+        try:
+            self.memory.set(key, [asdict(vf) for vf in verified], ttl=self.cache_ttl)
+        except Exception as e:
+            logger.warning("verify_facts cache set failed: %s", e)
+        return verified
+
+    def _verify_facts(self, sources: List[Source], min_support: int, fuzzy_threshold: int, ner_required: bool, entities: Optional[Dict[str, frozenset]] = None) -> List[VerifiedFact]:
         # extract candidate sentences from each source
         claim_map: Dict[str, List[Source]] = {}
+        # (claim, url) pairs already recorded: one hash probe instead of scanning the claim's sources
+        seen_pairs = set()
         for src in sources:
             text = src.snippet or ""
+            # normalization never lengthens text, so a short snippet cannot yield a claim
+            if len(text) < _MIN_CLAIM_LEN:
+                continue
             sents = self._sentences_from_text(text)
             for s in sents:
                 norm = self._normalize_claim(s)
-                if len(norm) < 40:  # skip short, low-content
+                if len(norm) < _MIN_CLAIM_LEN:  # skip short, low-content
                     continue
-                claim_map.setdefault(norm, [])
+                bucket = claim_map.setdefault(norm, [])
                 # add source only once per claim
-                if not any(existing.url == src.url for existing in claim_map[norm]):
-                    claim_map[norm].append(src)
+                if (norm, src.url) not in seen_pairs:
+                    seen_pairs.add((norm, src.url))
+                    bucket.append(src)
 
         # Merge similar claims using fuzzy matching to allow minor variations
-        claims = list(claim_map.keys())
-        clusters: List[Dict] = []  # list of {rep: claim, members: [claim], sources: set()}
-
-        try:
-            from rapidfuzz import fuzz
-            _have_fuzzy = True
-        except Exception:
-            fuzz = None
-            _have_fuzzy = False
-
-        for c in claims:
-            placed = False
-            for cl in clusters:
-                rep = cl["rep"]
-                sim = 0
-                if _have_fuzzy:
-                    sim = fuzz.token_sort_ratio(c, rep)
-                else:
-                    # fallback to substring match
-                    sim = 100 if (c in rep or rep in c) else 0
-                if sim >= fuzzy_threshold:
-                    cl["members"].append(c)
-                    for src in claim_map[c]:
-                        cl["sources"].add(src.url)
-                    placed = True
-                    break
-            if not placed:
-                cl = {"rep": c, "members": [c], "sources": set([s.url for s in claim_map[c]])}
-                clusters.append(cl)
+        clusters = self._cluster_claims(list(claim_map.keys()), fuzzy_threshold)
 
         # collect claims with enough supporting sources (after merging)
-        verified: List[VerifiedFact] = []
-
-        # extract_entities is imported at module top from crewai_agents_helpers
-
-        for cl in clusters:
-            src_urls = cl["sources"]
+        candidates: List[Tuple[List[str], List[Source]]] = []
+        for members in clusters:
             # gather Source objects from original map for these URLs
             supporting_srcs: List[Source] = []
             seen = set()
-            for member in cl["members"]:
+            for member in members:
                 for s in claim_map[member]:
                     if s.url in seen:
                         continue
                     supporting_srcs.append(s)
                     seen.add(s.url)
-
             if len(supporting_srcs) >= min_support:
-                # if ner_required, ensure at least one overlapping entity across supporting sources
-                if ner_required:
-                    entity_sets = [extract_entities(s.snippet or "") for s in supporting_srcs]
-                    if not entity_sets:
+                candidates.append((members, supporting_srcs))
+
+        entities_by_url: Dict[str, frozenset] = {}
+        if ner_required and candidates:
+            # entities per source, computed once: one batched NER pass over the distinct snippets
+            # of every supporting source, shared by all clusters that source appears in
+            by_url = {s.url: s for _, srcs in candidates for s in srcs}
+            snippets = list(dict.fromkeys(s.snippet or "" for s in by_url.values()))
+            known = entities or {}
+            ents = {t: known[t] for t in snippets if t in known}
+            missing = [t for t in snippets if t not in known]
+            if missing:
+                ents.update(zip(missing, crewai_agents_helpers.extract_entities_batch(missing)))
+            entities_by_url = {url: ents[s.snippet or ""] for url, s in by_url.items()}
+
+        verified: List[VerifiedFact] = []
+        for members, supporting_srcs in candidates:
+            # if ner_required, ensure at least one overlapping entity across supporting sources
+            if ner_required:
+                # intersect entities across sources (ignoring sources without entities); require at
+                # least one in common, bailing out as soon as the running intersection is empty
+                inter = None
+                for s in supporting_srcs:
+                    es = entities_by_url[s.url]
+                    if not es:
                         continue
-                    # intersect entities across sources; require at least one in common
-                    inter = set.intersection(*[es for es in entity_sets if es]) if entity_sets else set()
+                    inter = es if inter is None else inter & es
                     if not inter:
-                        continue
-                # pick representative claim text as the longest member (heuristic)
-                rep_claim = max(cl["members"], key=lambda x: len(x))
-                verified.append(VerifiedFact(claim=rep_claim, supporting_sources=supporting_srcs))
+                        break
+                if not inter:
+                    continue
+            # pick representative claim text as the longest member (heuristic)
+            rep_claim = max(members, key=lambda x: len(x))
+            verified.append(VerifiedFact(claim=rep_claim, supporting_sources=supporting_srcs))
 
         # sort by number of supporting sources desc
         verified.sort(key=lambda vf: len(vf.supporting_sources), reverse=True)
@@ -202,6 +458,43 @@ class SeniorResearchAnalyst:
         verified = self.verify_facts(sources)
         return verified
 
+    def run_batch(self, topics: Sequence[str], ner_required: bool = False) -> Dict[str, List[VerifiedFact]]:
+        """Research several topics at once, returning {topic: verified facts}.
+
+        Searches are fanned out concurrently (the tool's own `search_many` when it has one,
+        otherwise a thread pool), and with `ner_required` all snippets go through a single
+        batched NER pass shared by every topic. Claims are still clustered per topic.
+        """
+        unique = list(dict.fromkeys(topics))
+        search_many = getattr(self.search_tool, "search_many", None)
+        if search_many is not None:
+            found = search_many(unique, limit=self.search_limit)
+            sources_by_topic = {t: self._select(found[t]) for t in unique}
+        elif unique:
+            with ThreadPoolExecutor(max_workers=min(len(unique), 8)) as ex:
+                sources_by_topic = dict(zip(unique, ex.map(self.search_and_collect, unique)))
+        else:
+            sources_by_topic = {}
+
+        entities = None
+        if ner_required:
+            snippets = list(dict.fromkeys(s.snippet or "" for srcs in sources_by_topic.values() for s in srcs))
+            entities = dict(zip(snippets, crewai_agents_helpers.extract_entities_batch(snippets)))
+
+        return {t: self.verify_facts(srcs, ner_required=ner_required, entities=entities) for t, srcs in sources_by_topic.items()}
+
+    async def run_async(self, topic: str) -> List[VerifiedFact]:
+        """Async variant of `run`: awaits the tool's `asearch` when it has one, otherwise the
+        blocking search is offloaded to a thread so it can overlap other I/O."""
+        asearch = getattr(self.search_tool, "asearch", None)
+        if asearch is not None:
+            logger.info("Searching for sources on topic: %s", topic)
+            sources = self._select(await asearch(topic, limit=self.search_limit))
+        else:
+            sources = await asyncio.to_thread(self.search_and_collect, topic)
+        # verification is CPU-bound (cdist, NER); keep it off the loop so other topics' awaits proceed
+        return await asyncio.to_thread(self.verify_facts, sources)
+
 # --- TechnicalContentWriter ---
 
 class TechnicalContentWriter:
@@ -211,44 +504,161 @@ class TechnicalContentWriter:
         self.output_path = output_path
 
     def synthesize(self, topic: str, facts: List[VerifiedFact]) -> str:
-        header = f"# Research Report: {topic}\n"
-        meta = f"_Generated on {datetime.date.today().isoformat()}_\n\n"
-        summary = "## Executive Summary\n\n"
+        return self._render(topic, facts)
+
+    def _render(self, topic: str, facts: List[VerifiedFact], drafts: Optional[Sequence[str]] = None) -> str:
+        # accumulate fragments and join once; repeated `str +=` is quadratic in report length
+        parts: List[str] = []
+        append = parts.append
+        today = datetime.date.today().isoformat()
+
+        append(f"# Research Report: {topic}\n")
+        append(f"_Generated on {today}_\n\n")
+        append("## Executive Summary\n\n")
         if facts:
-            summary += f"This report synthesizes {len(facts)} cross-verified facts about **{topic}**. Each fact is supported by multiple sources.\n\n"
+            append(f"This report synthesizes {len(facts)} cross-verified facts about **{topic}**. Each fact is supported by multiple sources.\n\n")
         else:
-            summary += "No verified facts were found for this topic with current search parameters.\n\n"
+            append("No verified facts were found for this topic with current search parameters.\n\n")
 
-        body = "## Key Verified Facts\n\n"
+        append("## Key Verified Facts\n\n")
+        # unique sources by url, collected during the facts pass (dicts keep first-seen order)
+        unique_sources: Dict[str, Source] = {}
         for i, vf in enumerate(facts, start=1):
-            body += f"### Fact {i}\n\n"
-            body += f"- **Claim:** {vf.claim}\n"
-            body += f"- **Supported by:**\n"
+            append(f"### Fact {i}\n\n")
+            if drafts and drafts[i - 1]:
+                append(f"{drafts[i - 1]}\n\n")
+            append(f"- **Claim:** {vf.claim}\n")
+            append("- **Supported by:**\n")
             for src in vf.supporting_sources:
                 published = f" ({src.published})" if src.published else ""
-                body += f"  - [{src.title}]({src.url}){published}\n"
-            body += "\n"
+                append(f"  - [{src.title}]({src.url}){published}\n")
+                unique_sources.setdefault(src.url, src)
+            append("\n")
 
-        sources_section = "## All Sources (top)\n\n"
-        # list unique sources
-        seen_urls = set()
-        for vf in facts:
-            for src in vf.supporting_sources:
-                if src.url in seen_urls:
-                    continue
-                seen_urls.add(src.url)
-                sources_section += f"- [{src.title}]({src.url}) - snippet: {src.snippet}\n"
+        append("## All Sources (top)\n\n")
+        for src in unique_sources.values():
+            append(f"- [{src.title}]({src.url}) - snippet: {src.snippet}\n")
 
-        md = header + meta + summary + body + sources_section
-        return md
+        return "".join(parts)
 
     def save(self, md_text: str) -> None:
         with open(self.output_path, "w", encoding="utf-8") as f:
             f.write(md_text)
         logger.info("Saved report to %s", self.output_path)
 
+
+class AsyncTechnicalContentWriter(TechnicalContentWriter):
+    """Writer that asks an LLM for one explanatory paragraph per verified fact.
+
+    The per-fact drafts are independent, so `asynthesize` issues them together with
+    `asyncio.gather` (bounded by `max_concurrency` to respect provider rate limits); a report
+    takes roughly one LLM round-trip instead of one per fact. Without an LLM it renders the
+    same report as `synthesize`.
+
+    If a `memory` backend is given, the drafts are memoized there keyed on (topic, facts), so
+    re-running an unchanged topic skips the LLM entirely (entries expire after `cache_ttl` seconds).
+    The report itself is re-rendered on a hit, which keeps its generation date current.
+    """
+
+    def __init__(self, output_path: str = "research_report.md", llm: Optional[Any] = None, max_concurrency: int = 8, memory: Optional[Memory] = None, cache_ttl: Optional[int] = 86400):
+        super().__init__(output_path=output_path)
+        self.llm = llm
+        self.max_concurrency = max_concurrency
+        self.memory = memory
+        self.cache_ttl = cache_ttl
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sem_loop = None
+
+    @staticmethod
+    def _draft_prompt(topic: str, fact: VerifiedFact) -> str:
+        return (
+            f"You are a concise technical writer. In one short paragraph, explain the following claim about '{topic}', "
+            f"which was cross-verified by {len(fact.supporting_sources)} sources. Do not add facts beyond the claim.\n\n"
+            f"Claim: {fact.claim}"
+        )
+
+    def _get_sem(self) -> asyncio.Semaphore:
+        # one semaphore per event loop, shared by every report this writer drafts concurrently
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+            self._sem_loop = loop
+        return self._sem
+
+    async def _draft(self, topic: str, fact: VerifiedFact) -> str:
+        prompt = self._draft_prompt(topic, fact)
+        async with self._get_sem():
+            try:
+                # prefer a native async adapter; otherwise run the blocking SDK call in a worker thread
+                agenerate = getattr(self.llm, "agenerate", None)
+                if agenerate is not None:
+                    return await agenerate(prompt, max_tokens=200)
+                return await asyncio.to_thread(self.llm.generate, prompt, max_tokens=200)
+            except Exception as e:
+                logger.warning("LLM draft failed for claim %r: %s", fact.claim[:60], e)
+                return ""
+
+    def _drafts_cache_key(self, topic: str, facts: List[VerifiedFact]) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{type(self.llm).__name__}\x1f{topic}\x1e".encode())
+        for vf in facts:
+            h.update(vf.claim.encode())
+            for src in vf.supporting_sources:
+                h.update(f"\x1f{src.url}".encode())
+            h.update(b"\x1e")
+        return f"drafts:{h.hexdigest()}"
+
+    async def asynthesize(self, topic: str, facts: List[VerifiedFact]) -> str:
+        if self.llm is None or not facts:
+            return self._render(topic, facts)
+
+        key = None
+        if self.memory is not None:
+            key = self._drafts_cache_key(topic, facts)
+            try:
+                cached = self.memory.get(key)
+            except Exception as e:
+                logger.warning("Draft cache get failed: %s", e)
+                cached = None
+            if cached is not None and len(cached) == len(facts):
+                logger.info("Fact drafts served from cache (%d)", len(cached))
+                return self._render(topic, facts, cached)
+
+        drafts = await asyncio.gather(*(self._draft(topic, vf) for vf in facts))
+        # failed drafts come back empty; only cache a complete set
+        if key is not None and all(drafts):
+            try:
+                self.memory.set(key, list(drafts), ttl=self.cache_ttl)
+            except Exception as e:
+                logger.warning("Draft cache set failed: %s", e)
+        return self._render(topic, facts, drafts)
+
 # --- Helper utility for sequential orchestration (example usage) ---
 
+def _resolve_search_tool(search_tool: Optional[SearchTool], use_mock: bool) -> SearchTool:
+    if search_tool is not None:
+        return search_tool
+    if use_mock:
+        return MockTavilyClient()
+    # lazy import to avoid hard dependency when using mock
+    try:
+        from tavily_adapter import TavilyClient
+    except Exception as e:
+        raise ValueError("TavilyClient not available; ensure tavily_adapter.py exists and dependencies are installed") from e
+
+    # construct from env vars (TAVILY_API_KEY required)
+    return TavilyClient()
+
+
+def report_path_for_topic(output_path: str, topic: str) -> str:
+    """Derive a per-topic report path from `output_path`, e.g. report.md -> report_quantum_computing.md."""
+    stem, dot, ext = output_path.rpartition(".")
+    if not dot or "/" in ext:
+        stem, ext = output_path, "md"
+    slug = re.sub(r"[^a-z0-9]+", "_", topic.lower()).strip("_") or "topic"
+    return f"{stem}_{slug}.{ext}"
+
+
 def run_sequential_team(topic: str, output_path: str = "research_report.md", use_mock: bool = True, search_tool: Optional[SearchTool] = None) -> Tuple[str, List[VerifiedFact]]:
     """Run the two-agent team sequentially and write the report.
 
@@ -258,18 +668,7 @@ def run_sequential_team(topic: str, output_path: str = "research_report.md", use
 
     Returns the markdown string and the list of verified facts.
     """
-    if search_tool is None:
-        if use_mock:
-            search_tool = MockTavilyClient()
-        else:
-            # lazy import to avoid hard dependency when using mock
-            try:
-                from tavily_adapter import TavilyClient
-            except Exception as e:
-                raise ValueError("TavilyClient not available; ensure tavily_adapter.py exists and dependencies are installed") from e
-
-            # construct from env vars (TAVILY_API_KEY required)
-            search_tool = TavilyClient()
+    search_tool = _resolve_search_tool(search_tool, use_mock)
 
     analyst = SeniorResearchAnalyst(search_tool=search_tool)
     writer = TechnicalContentWriter(output_path=output_path)
@@ -293,6 +692,44 @@ def run_sequential_team(topic: str, output_path: str = "research_report.md", use
     writer.save(md)
     return md, verified_facts
 
+async def run_parallel_team(topics: Sequence[str], output_path: str = "research_report.md", use_mock: bool = True, search_tool: Optional[SearchTool] = None, llm: Optional[Any] = None, max_concurrency: Optional[int] = None, memory: Optional[Memory] = None) -> Dict[str, Tuple[str, List[VerifiedFact]]]:
+    """Async counterpart of `run_sequential_team` for one or more topics.
+
+    Each topic's analyst -> writer pipeline runs concurrently under `asyncio.gather`, so the
+    I/O-bound searches overlap. A single topic is written to `output_path`; with several topics
+    each report goes to `report_path_for_topic(output_path, topic)`. When `llm` is given, the
+    writer adds an LLM-drafted paragraph per fact (see `AsyncTechnicalContentWriter`).
+    `max_concurrency` caps how many topics are in flight at once (default: all of them).
+    `memory` (optional) caches the LLM drafts across runs.
+
+    Returns {topic: (markdown, verified facts)}.
+    """
+    owns_tool = search_tool is None
+    search_tool = _resolve_search_tool(search_tool, use_mock)
+    analyst = SeniorResearchAnalyst(search_tool=search_tool)
+    unique = list(dict.fromkeys(topics))
+    # one drafting writer for all topics so its concurrency bound applies to the whole batch
+    drafter = AsyncTechnicalContentWriter(output_path=output_path, llm=llm, memory=memory)
+    sem = asyncio.Semaphore(max_concurrency or max(1, len(unique)))
+
+    async def _one(topic: str) -> Tuple[str, List[VerifiedFact]]:
+        path = output_path if len(unique) == 1 else report_path_for_topic(output_path, topic)
+        writer = TechnicalContentWriter(output_path=path)
+        async with sem:
+            verified_facts = await analyst.run_async(topic)
+            md = await drafter.asynthesize(topic, verified_facts)
+            await asyncio.to_thread(writer.save, md)
+        return md, verified_facts
+
+    try:
+        results = await asyncio.gather(*(_one(t) for t in unique))
+    finally:
+        # release the tool's async HTTP client before the event loop goes away
+        aclose = getattr(search_tool, "aclose", None)
+        if owns_tool and aclose is not None:
+            await aclose()
+    return dict(zip(unique, results))
+
 if __name__ == "__main__":
     # quick demonstration
     md, facts = run_sequential_team("Artificial Intelligence", output_path="research_report.md", use_mock=True)
@@ -3,34 +3,146 @@
 This module isolates NER functionality so it can be monkeypatched easily in tests.
 """
 from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, FrozenSet, List, Optional, Tuple
+import os
 import re
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
-# Try to load spaCy model lazily
-_nlp = None
-try:
-    import spacy  # type: ignore
-    try:
-        _nlp = spacy.load("en_core_web_sm")
-    except Exception:
-        # model not available; remain None
-        _nlp = None
-except Exception:
-    _nlp = None
+# Only the NER component is used here (it has its own tok2vec); the rest is disabled to cut per-doc cost
+_NER_DISABLED_PIPES = ["parser", "tagger", "attribute_ruler", "lemmatizer"]
+_PIPE_BATCH_SIZE = 64
+# Worker processes for `nlp.pipe` (SPACY_N_PROCESS, default 1). Every worker loads its own copy of
+# the model, so multiprocessing is only used for batches of at least _PIPE_MP_MIN_TEXTS texts.
+_PIPE_N_PROCESS = int(os.environ.get("SPACY_N_PROCESS", "1"))
+_PIPE_MP_MIN_TEXTS = 512
+
+# spaCy model, loaded on first use by `_get_nlp` (importing spaCy and the model takes seconds);
+# None once loading has failed, i.e. spaCy or en_core_web_sm is unavailable
+_UNLOADED = object()
+_nlp = _UNLOADED
+_nlp_lock = threading.Lock()
+
+
+def _get_nlp():
+    global _nlp
+    if _nlp is _UNLOADED:
+        with _nlp_lock:
+            if _nlp is _UNLOADED:
+                try:
+                    import spacy  # type: ignore
+                    _nlp = spacy.load("en_core_web_sm", disable=_NER_DISABLED_PIPES)
+                except Exception:
+                    # spaCy or the model not available; use the regex fallback
+                    _nlp = None
+    return _nlp
+
+
+def _regex_entities(text: str) -> FrozenSet[str]:
+    # fallback: naive capitalized phrase extraction
+    matches = re.findall(r"\b([A-Z][a-zA-Z]{2,}(?:\s+[A-Z][a-zA-Z]{2,})*)\b", text)
+    return frozenset(m.lower() for m in matches)
+
+
+# Per-text entity cache shared by `extract_entities` and `extract_entities_batch`, keyed on
+# (text, model) so entries computed by a previous (swapped or reloaded) pipeline are not served.
+# A plain LRU dict rather than functools.lru_cache because the batch path has to look up hits
+# and store the results of a single `nlp.pipe` pass over the misses.
+_ENTITY_CACHE_SIZE = 2048
+_entity_cache: "OrderedDict[Tuple[str, Any], FrozenSet[str]]" = OrderedDict()
+_entity_cache_lock = threading.Lock()
+
+
+def _cache_get(text: str, nlp: Any) -> Optional[FrozenSet[str]]:
+    key = (text, nlp)
+    with _entity_cache_lock:
+        ents = _entity_cache.get(key)
+        if ents is not None:
+            _entity_cache.move_to_end(key)
+        return ents
+
+
+def _cache_put(text: str, nlp: Any, ents: FrozenSet[str]) -> None:
+    with _entity_cache_lock:
+        _entity_cache[(text, nlp)] = ents
+        _entity_cache.move_to_end((text, nlp))
+        while len(_entity_cache) > _ENTITY_CACHE_SIZE:
+            _entity_cache.popitem(last=False)
+
+
+def _extract_entities_cached(text: str, nlp: Any) -> FrozenSet[str]:
+    # frozenset so the cached value can't be mutated by callers
+    ents = _cache_get(text, nlp)
+    if ents is not None:
+        return ents
+    ents = None
+    if nlp is not None:
+        try:
+            doc = nlp(text)
+            ents = frozenset(ent.text.lower() for ent in doc.ents)
+        except Exception as e:
+            logger.warning("spaCy NER failed: %s", e)
+    if ents is None:
+        ents = _regex_entities(text)
+    _cache_put(text, nlp, ents)
+    return ents
 
 
 def extract_entities(text: str):
     """Return a set of entity strings extracted from text (lowercased)."""
     if not text:
         return set()
-    if _nlp is not None:
+    return set(_extract_entities_cached(text, _get_nlp()))
+
+
+# the shipped implementation; `extract_entities_batch` defers to a replacement (e.g. a test patch)
+_default_extract_entities = extract_entities
+
+
+def ner_backend_tag() -> str:
+    """Identify the entity extractor in use, for cache keys: the spaCy model name and version,
+    "regex" for the fallback, or the name of a replacement `extract_entities`."""
+    if extract_entities is not _default_extract_entities:
+        return f"custom:{getattr(extract_entities, '__module__', '')}.{getattr(extract_entities, '__qualname__', '')}"
+    nlp = _get_nlp()
+    if nlp is None:
+        return "regex"
+    meta = getattr(nlp, "meta", None) or {}
+    return f"spacy:{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}"
+
+
+def extract_entities_batch(texts: List[str]) -> List[FrozenSet[str]]:
+    """Extract entities for many texts at once; result i corresponds to texts[i].
+
+    With spaCy available, distinct texts not already in the entity cache shared with
+    `extract_entities` are streamed through `nlp.pipe` in batches, which amortizes per-call
+    pipeline overhead (spread over SPACY_N_PROCESS workers for large batches), and the results
+    are added to the cache.
+    Without it, or when the module's `extract_entities` has been replaced (tests monkeypatch it),
+    each text goes through `extract_entities`, looked up at call time.
+    """
+    nlp = _get_nlp()
+    if nlp is None or extract_entities is not _default_extract_entities:
+        return [frozenset(extract_entities(t)) for t in texts]
+    found = {}
+    misses = []
+    for t in dict.fromkeys(t for t in texts if t):
+        ents = _cache_get(t, nlp)
+        if ents is None:
+            misses.append(t)
+        else:
+            found[t] = ents
+    if misses:
+        n_process = _PIPE_N_PROCESS if len(misses) >= _PIPE_MP_MIN_TEXTS else 1
         try:
-            doc = _nlp(text)
-            return {ent.text.lower() for ent in doc.ents}
+            docs = nlp.pipe(misses, batch_size=_PIPE_BATCH_SIZE, n_process=n_process)
+            for t, doc in zip(misses, docs):
+                found[t] = frozenset(ent.text.lower() for ent in doc.ents)
+                _cache_put(t, nlp, found[t])
         except Exception as e:
-            logger.warning("spaCy NER failed: %s", e)
-    # fallback: naive capitalized phrase extraction
-    matches = re.findall(r"\b([A-Z][a-zA-Z]{2,}(?:\s+[A-Z][a-zA-Z]{2,})*)\b", text)
-    return {m.lower() for m in matches}
+            logger.warning("spaCy batch NER failed, falling back to per-text extraction: %s", e)
+            return [frozenset(extract_entities(t)) for t in texts]
+    return [found.get(t, frozenset()) for t in texts]
@@ -1,15 +1,20 @@
 """Pluggable LLM adapters for GPT-4o and Claude 3.5 Sonnet.
 
 Adapters check for SDK availability and env-based API keys. Each adapter implements
-`generate(prompt, **kwargs) -> str`.
+`generate(prompt, **kwargs) -> str`; async-capable adapters also implement
+`agenerate(prompt, **kwargs) -> str` (awaitable).
 
 Env vars used:
 - GPT4O_API_KEY (for GPT-4o/openai-compatible)
 - CLAUDE_API_KEY (for Claude/Anthropic-like)
 - LLM_PROVIDER can be used externally to choose a provider (gpt4o|claude|mock)
+- LLM_CACHE=1 makes `make_llm` wrap the adapter in `CachingLLM` (LLM_CACHE_TTL: entry TTL in seconds);
+  `make_llm(use_cache=False)` overrides it
 """
 from __future__ import annotations
-from typing import Protocol, Optional, Dict
+from typing import Any, Protocol, Optional, Dict
+import asyncio
+import hashlib
 import os
 import logging
 
@@ -26,16 +31,31 @@ class MockLLMAdapter:
         return f"MOCK RESPONSE FOR: {prompt[:200]}"
 
 
-# GPT-4o adapter (example using an 'openai' compatible interface)
+def _chat_text(resp) -> str:
+    """Extract the assistant text from an OpenAI chat completion (object or dict form)."""
+    if isinstance(resp, dict):
+        # compatibility with dict-like responses
+        choices = resp.get("choices") or []
+        if choices:
+            return choices[0].get("message", {}).get("content", "")
+        return str(resp)
+    choices = getattr(resp, "choices", None) or []
+    if choices:
+        return choices[0].message.content or ""
+    # fallback
+    return str(resp)
+
+
+# GPT-4o adapter (openai>=1.0 client interface)
 class GPT4oAdapter:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("GPT4O_API_KEY") or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
             raise RuntimeError("GPT4o API key not found in GPT4O_API_KEY or OPENAI_API_KEY env vars")
         try:
-            import openai
-            self._client = openai
-            self._client.api_key = self.api_key
+            # one client per adapter: its HTTP connection pool (TLS sessions, keep-alive) is reused across calls
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self.api_key)
         except Exception as e:  # pragma: no cover - platform deps
             logger.warning("openai package not available; GPT4oAdapter will raise if used: %s", e)
             self._client = None
@@ -43,29 +63,79 @@ class GPT4oAdapter:
     def generate(self, prompt: str, **kwargs) -> str:
         if self._client is None:
             raise RuntimeError("openai package not available for GPT4oAdapter")
-        # Minimal example using the completions-like interface; adjust to your SDK
-        resp = self._client.ChatCompletion.create(model=kwargs.get("model", "gpt-4o-mini"), messages=[{"role": "user", "content": prompt}], max_tokens=kwargs.get("max_tokens", 512))
-        # Extract text
-        if isinstance(resp, dict):
-            # compatibility with dict-like responses
-            choices = resp.get("choices") or []
-            if choices:
-                return choices[0].get("message", {}).get("content", "")
-        # fallback
-        return str(resp)
+        resp = self._client.chat.completions.create(model=kwargs.get("model", "gpt-4o-mini"), messages=[{"role": "user", "content": prompt}], max_tokens=kwargs.get("max_tokens", 512))
+        return _chat_text(resp)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
 
 
-# Claude adapter (example using an 'anthropic-like' interface)
+# Async GPT-4o adapter (openai>=1.0 `AsyncOpenAI` client) for the asyncio agent path
+class AsyncGPT4oAdapter(GPT4oAdapter):
+    def __init__(self, api_key: Optional[str] = None):
+        super().__init__(api_key=api_key)
+        try:
+            from openai import AsyncOpenAI
+            self._async_cls = AsyncOpenAI
+        except Exception as e:  # pragma: no cover - platform deps
+            logger.warning("openai.AsyncOpenAI not available; AsyncGPT4oAdapter.agenerate will raise if used: %s", e)
+            self._async_cls = None
+        # the async client's connection pool is bound to the loop that created it: built on first
+        # use and rebuilt when the running loop changes (see `_get_aclient`)
+        self._aclient = None
+        self._aclient_loop = None
+        self._aclient_closer: Optional[asyncio.Task] = None
+
+    def _get_aclient(self):
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            stale_loop, stale_closer = self._aclient_loop, self._aclient_closer
+            if stale_closer is not None and not stale_loop.is_closed():
+                # the old client can only be closed on its own loop; it runs the close when next active
+                stale_loop.call_soon_threadsafe(stale_closer.cancel)
+            self._aclient = self._async_cls(api_key=self.api_key)
+            self._aclient_loop = loop
+            self._aclient_closer = loop.create_task(self._close_on_cancel(self._aclient))
+        return self._aclient
+
+    @staticmethod
+    async def _close_on_cancel(client) -> None:
+        # Parked until cancelled, then closes `client`; asyncio.run/uvloop.run cancel leftover tasks
+        # before closing the loop, so the client is released even if `aclose` is never awaited
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await client.close()
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        if self._async_cls is None:
+            raise RuntimeError("openai>=1.0 package not available for AsyncGPT4oAdapter")
+        resp = await self._get_aclient().chat.completions.create(model=kwargs.get("model", "gpt-4o-mini"), messages=[{"role": "user", "content": prompt}], max_tokens=kwargs.get("max_tokens", 512))
+        return _chat_text(resp)
+
+    async def aclose(self) -> None:
+        """Close the async client (call before the event loop shuts down)."""
+        client, closer = self._aclient, self._aclient_closer
+        self._aclient = self._aclient_loop = self._aclient_closer = None
+        if closer is not None and closer.get_loop() is asyncio.get_running_loop():
+            closer.cancel()
+            await asyncio.gather(closer, return_exceptions=True)
+        if client is not None:
+            # closing twice is a no-op; needed when the closer was cancelled before it ever ran
+            await client.close()
+
+
+# Claude adapter (anthropic SDK messages interface)
 class ClaudeAdapter:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("CLAUDE_API_KEY")
         if not self.api_key:
             raise RuntimeError("Claude API key not found in CLAUDE_API_KEY env var")
         try:
+            # instantiate the client once and reuse its connection pool across calls
             import anthropic
-            self._client = anthropic
-            # instantiate client if SDK requires
-            # self._client = anthropic.Client(self.api_key)
+            self._client = anthropic.Anthropic(api_key=self.api_key)
         except Exception as e:  # pragma: no cover - platform deps
             logger.warning("anthropic package not available; ClaudeAdapter will raise if used: %s", e)
             self._client = None
@@ -73,22 +143,100 @@ class ClaudeAdapter:
     def generate(self, prompt: str, **kwargs) -> str:
         if self._client is None:
             raise RuntimeError("anthropic package not available for ClaudeAdapter")
-        # Minimal example - adjust to the exact SDK you have
-        resp = self._client.Completion.create(prompt=prompt, max_tokens=kwargs.get("max_tokens", 512))
+        resp = self._client.messages.create(model=kwargs.get("model", "claude-3-5-sonnet-latest"), max_tokens=kwargs.get("max_tokens", 512), messages=[{"role": "user", "content": prompt}])
         if isinstance(resp, dict):
             return resp.get("completion", "")
-        return str(resp)
+        blocks = getattr(resp, "content", None) or []
+        text = "".join(getattr(b, "text", "") for b in blocks)
+        return text or str(resp)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
+
+# Response cache decorator
+
+class CachingLLM:
+    """Wrap an adapter and memoize responses in a `Memory` backend (e.g. Redis).
+
+    Keys are a blake2b digest of (adapter type, prompt, model, max_tokens), so a repeated prompt
+    costs one memory GET instead of a full LLM round-trip, and providers sharing a memory backend
+    never see each other's completions. Empty responses are not cached.
+    """
+
+    def __init__(self, inner: LLMAdapter, memory: Any, ttl: Optional[int] = None):
+        self.inner = inner
+        self.memory = memory
+        self.ttl = ttl
+
+    def _key(self, prompt: str, **kwargs) -> str:
+        raw = f"{type(self.inner).__name__}|{kwargs.get('model', '')}|{kwargs.get('max_tokens', '')}|{prompt}"
+        return "llm:" + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[str]:
+        try:
+            return self.memory.get(key)
+        except Exception as e:
+            logger.warning("LLM cache get failed: %s", e)
+            return None
+
+    def _store(self, key: str, out: str) -> None:
+        if not out:
+            return
+        try:
+            self.memory.set(key, out, ttl=self.ttl)
+        except Exception as e:
+            logger.warning("LLM cache set failed: %s", e)
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        key = self._key(prompt, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        out = self.inner.generate(prompt, **kwargs)
+        self._store(key, out)
+        return out
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        key = self._key(prompt, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        agenerate = getattr(self.inner, "agenerate", None)
+        if agenerate is not None:
+            out = await agenerate(prompt, **kwargs)
+        else:
+            out = await asyncio.to_thread(self.inner.generate, prompt, **kwargs)
+        self._store(key, out)
+        return out
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 # Factory helper
 
-def make_llm(provider: Optional[str] = None) -> LLMAdapter:
+def make_llm(provider: Optional[str] = None, memory: Optional[Any] = None, use_cache: Optional[bool] = None) -> LLMAdapter:
     # Default to GPT-4o for best general-purpose reasoning unless overridden
     provider = provider or os.environ.get("LLM_PROVIDER") or "gpt4o"
     provider = provider.lower()
     if provider == "gpt4o":
-        return GPT4oAdapter()
+        # async-capable subclass: `agenerate` lets async callers (e.g. per-fact drafting) await the API
+        llm: LLMAdapter = AsyncGPT4oAdapter()
     elif provider == "claude":
-        return ClaudeAdapter()
+        llm = ClaudeAdapter()
     else:
-        return MockLLMAdapter()
+        llm = MockLLMAdapter()
+
+    if use_cache is None:
+        use_cache = os.environ.get("LLM_CACHE") == "1"
+    if use_cache:
+        if memory is None:
+            from agents_core import InMemoryMemory
+            memory = InMemoryMemory()
+        ttl = os.environ.get("LLM_CACHE_TTL")
+        llm = CachingLLM(llm, memory, ttl=int(ttl) if ttl else None)
+    return llm
@@ -10,32 +10,40 @@ are provided to the writer. The LLM only receives the verified facts and a short
 """
 from __future__ import annotations
 from typing import List, Optional
+import asyncio
 import logging
 import datetime
 
 from crewai_agents import SeniorResearchAnalyst, TechnicalContentWriter, VerifiedFact, Source
 from llm_adapters import make_llm, LLMAdapter, MockLLMAdapter
+from agents_core import Memory
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
 class PersonalResearcher:
-    def __init__(self, search_tool, llm: Optional[LLMAdapter] = None, output_path: str = "research_report.md"):
+    def __init__(self, search_tool, llm: Optional[LLMAdapter] = None, output_path: str = "research_report.md", memory: Optional[Memory] = None):
         self.search_tool = search_tool
-        self.analyst = SeniorResearchAnalyst(search_tool=search_tool)
+        self.memory = memory
+        # memory (when given) lets the analyst reuse verification results across runs
+        self.analyst = SeniorResearchAnalyst(search_tool=search_tool, memory=memory)
         self.llm = llm or make_llm()
         self.writer = TechnicalContentWriter(output_path=output_path)
         self.output_path = output_path
 
+    @staticmethod
+    def _summary_prompt(topic: str, facts: List[VerifiedFact]) -> str:
+        # Build a compact prompt describing the facts (parts joined once, not concatenated per fact)
+        parts = [f"You are a concise technical researcher. Write a 3-paragraph executive summary for the topic '{topic}' based on the following verified facts:\n\n"]
+        parts.extend(f"Fact {i}: {vf.claim} (supported by {len(vf.supporting_sources)} sources).\n" for i, vf in enumerate(facts, start=1))
+        parts.append("\nKeep it concise, factual, and cite that the claims were cross-verified by multiple sources.")
+        return "".join(parts)
+
     def _llm_summarize(self, topic: str, facts: List[VerifiedFact]) -> str:
         if facts is None or len(facts) == 0:
             return "No verified facts available to summarize."
-        # Build a compact prompt describing the facts
-        prompt = f"You are a concise technical researcher. Write a 3-paragraph executive summary for the topic '{topic}' based on the following verified facts:\n\n"
-        for i, vf in enumerate(facts, start=1):
-            prompt += f"Fact {i}: {vf.claim} (supported by {len(vf.supporting_sources)} sources).\n"
-        prompt += "\nKeep it concise, factual, and cite that the claims were cross-verified by multiple sources."
+        prompt = self._summary_prompt(topic, facts)
 
         try:
             summary = self.llm.generate(prompt, max_tokens=400)
@@ -45,6 +53,36 @@ class PersonalResearcher:
             # Fallback: simple summary
             return "Summary unavailable (LLM error)."
 
+    async def _llm_summarize_async(self, topic: str, facts: List[VerifiedFact]) -> str:
+        if facts is None or len(facts) == 0:
+            return "No verified facts available to summarize."
+        prompt = self._summary_prompt(topic, facts)
+
+        try:
+            # prefer a native async adapter; otherwise run the blocking SDK call in a worker thread
+            agenerate = getattr(self.llm, "agenerate", None)
+            if agenerate is not None:
+                return await agenerate(prompt, max_tokens=400)
+            return await asyncio.to_thread(self.llm.generate, prompt, max_tokens=400)
+        except Exception as e:
+            logger.warning("LLM summarize failed: %s", e)
+            return "Summary unavailable (LLM error)."
+
+    def _assemble_report(self, topic: str, facts: List[VerifiedFact], summary: str) -> str:
+        # Create a structured report via writer
+        md = self.writer.synthesize(topic, facts)
+        # Insert summary under the Executive Summary heading; the report is joined once at the end
+        heading = "## Executive Summary\n\n"
+        before, found, after = md.partition(heading)
+        if found:
+            parts = [before, heading, summary, "\n\n", after]
+        else:
+            parts = [f"# Research Report: {topic}\n\n", heading, summary, "\n\n", md]
+
+        # add generation timestamp and LLM note
+        parts.append(f"\n\n---\n_Report generated on {datetime.date.today().isoformat()} with LLM-assisted summary._\n")
+        return "".join(parts)
+
     def run(self, topic: str) -> str:
         logger.info("PersonalResearcher: running topic %s", topic)
         facts = self.analyst.run(topic)
@@ -55,24 +93,21 @@ class PersonalResearcher:
             logger.warning("Error generating summary: %s", e)
             summary = ""
 
-        # Create a structured report via writer
-        md = self.writer.synthesize(topic, facts)
-        # Insert summary under Executive Summary heading
-        # naive insertion: find the Executive Summary header and replace its content until next header
-        if "## Executive Summary" in md:
-            parts = md.split("## Executive Summary\n\n")
-            before = parts[0]
-            rest = "## Executive Summary\n\n" + summary + "\n\n" + parts[1]
-            md = before + rest
-        else:
-            md = f"# Research Report: {topic}\n\n" + "## Executive Summary\n\n" + summary + "\n\n" + md
-
-        # add generation timestamp and LLM note
-        md += f"\n\n---\n_Report generated on {datetime.date.today().isoformat()} with LLM-assisted summary._\n"
-
+        md = self._assemble_report(topic, facts, summary)
         self.writer.save(md)
         return md
 
+    async def run_async(self, topic: str) -> str:
+        """Async variant of `run`: search runs off the event loop and the LLM call is awaited,
+        so several topics (one researcher each) can be researched concurrently with `asyncio.gather`.
+        """
+        logger.info("PersonalResearcher: running topic %s (async)", topic)
+        facts = await self.analyst.run_async(topic)
+        summary = await self._llm_summarize_async(topic, facts)
+
+        md = self._assemble_report(topic, facts, summary)
+        await asyncio.to_thread(self.writer.save, md)
+        return md
 
 if __name__ == "__main__":
     # demonstration with mock if run directly
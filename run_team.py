@@ -1,15 +1,109 @@
-"""CLI orchestrator for the two-agent team (sequential).
+"""CLI orchestrator for the two-agent team.
 
 Usage:
-    python run_team.py --topic "Your topic here" [--output research_report.md] [--no-mock]
+    python run_team.py --topic "Your topic here" [--topic "Another topic"] [--output research_report.md] [--no-mock]
+    python run_team.py --topics-file topics.txt [--workers 8]
+
+Topics are researched concurrently on an asyncio event loop (at most `--workers` at a time); with
+several topics each report is written next to `--output` with the topic appended to the file name.
+A topics file holds one topic per line; blank lines and lines starting with `#` are ignored.
 """
 import argparse
-from crewai_agents import run_sequential_team
+import asyncio
+from pathlib import Path
+from crewai_agents import run_parallel_team, report_path_for_topic
+
+# Optional libuv-based event loop (faster with many concurrent searches / LLM calls)
+try:
+    import uvloop
+except Exception:
+    uvloop = None
+
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def read_topics_file(path: str):
+    lines = (line.strip() for line in Path(path).read_text(encoding="utf-8").splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+async def _aclose(*resources) -> None:
+    # async clients (Tavily, LLM SDKs) hold loop-bound connection pools; release them before the loop ends
+    for resource in resources:
+        aclose = getattr(resource, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def amain(args) -> None:
+    topics = list(dict.fromkeys((args.topic or []) + (read_topics_file(args.topics_file) if args.topics_file else [])))
+    if not topics:
+        raise SystemExit("no topics given (use --topic and/or --topics-file)")
+    # construct memory and pass down
+    from agents_core import make_memory
+    memory = make_memory(backend=args.memory)
+    # --no-cache: recompute verification/LLM drafts instead of reusing results from earlier runs
+    cache = None if args.no_cache else memory
+
+    if args.agent == "personal_researcher":
+        # run the agent flow
+        from tavily_adapter import TavilyClient
+        from personal_researcher import PersonalResearcher
+        from llm_adapters import make_llm
+
+        if args.use_mock:
+            from crewai_agents import MockTavilyClient
+            search_tool = MockTavilyClient()
+        else:
+            search_tool = TavilyClient()
+
+        llm = make_llm(provider=args.llm, memory=memory, use_cache=False if args.no_cache else None)
+        agents = [
+            PersonalResearcher(
+                search_tool=search_tool,
+                llm=llm,
+                output_path=args.output if len(topics) == 1 else report_path_for_topic(args.output, t),
+                memory=cache,
+            )
+            for t in topics
+        ]
+        sem = asyncio.Semaphore(args.workers)
+
+        async def _run(agent, topic):
+            async with sem:
+                return await agent.run_async(topic)
+
+        try:
+            await asyncio.gather(*(_run(agent, t) for agent, t in zip(agents, topics)))
+        finally:
+            await _aclose(search_tool, llm)
+        for agent in agents:
+            print(f"PersonalResearcher completed. Report saved to {agent.output_path}")
+    else:
+        # with an explicit --llm the writer drafts a paragraph per fact; the plain team stays LLM-free
+        llm = None
+        if args.llm:
+            from llm_adapters import make_llm
+            llm = make_llm(provider=args.llm, memory=memory, use_cache=False if args.no_cache else None)
+        try:
+            results = await run_parallel_team(topics, output_path=args.output, use_mock=args.use_mock, llm=llm, max_concurrency=args.workers, memory=cache)
+        finally:
+            await _aclose(llm)
+        for topic, (md, facts) in results.items():
+            path = args.output if len(topics) == 1 else report_path_for_topic(args.output, topic)
+            print(f"Completed. Verified facts: {len(facts)}. Report saved to {path}")
 
 
 def main():
-    p = argparse.ArgumentParser(description="Run a two-agent research -> writer team (sequential)")
-    p.add_argument("--topic", required=True, help="Research topic; put in quotes if multi-word")
+    p = argparse.ArgumentParser(description="Run a two-agent research -> writer team")
+    p.add_argument("--topic", action="append", help="Research topic; put in quotes if multi-word. Repeat to research several topics concurrently")
+    p.add_argument("--topics-file", default=None, help="File with one topic per line, researched as one batch in this process")
+    p.add_argument("--workers", type=positive_int, default=8, help="Max topics researched concurrently (default 8)")
     p.add_argument("--output", default="research_report.md", help="Output markdown file path")
     p.add_argument(
         "--no-mock",
@@ -17,36 +111,18 @@ def main():
         action="store_false",
         help="Use a real Tavily client instead of the mock (requires TAVILY_API_KEY env var)",
     )
-    p.add_argument("--llm", default=None, choices=["gpt4o", "claude", "mock"], help="LLM provider to use (overrides LLM_PROVIDER env var)")
+    p.add_argument("--agent", default="team", choices=["team", "personal_researcher"], help="Flow to run: the analyst -> writer team or the LLM-assisted PersonalResearcher")
+    p.add_argument("--llm", default=None, choices=["gpt4o", "claude", "mock"], help="LLM provider to use (overrides LLM_PROVIDER env var); with the team flow, enables per-fact LLM drafts")
     p.add_argument("--memory", default="redis", choices=["redis", "inmemory"], help="Memory backend (redis or inmemory)")
+    p.add_argument("--no-cache", action="store_true", help="Ignore cached verification results and LLM drafts; regenerate the report")
     args = p.parse_args()
+    if not args.topic and not args.topics_file:
+        p.error("one of --topic or --topics-file is required")
 
     try:
-        # construct memory and pass down
-        from agents_core import make_memory
-        memory = make_memory(backend=args.memory)
-
-        if args.agent == "personal_researcher":
-            # run the agent flow
-            from tavily_adapter import TavilyClient
-            from personal_researcher import PersonalResearcher
-            from llm_adapters import make_llm
-
-            if args.use_mock:
-                from crewai_agents import MockTavilyClient
-                search_tool = MockTavilyClient()
-            else:
-                search_tool = TavilyClient()
-
-            llm = make_llm(provider=args.llm) if args.llm else make_llm()
-            agent = PersonalResearcher(search_tool=search_tool, llm=llm, output_path=args.output)
-            md = agent.run(args.topic)
-            facts = []
-            print(f"PersonalResearcher completed. Report saved to {args.output}")
-        else:
-            md, facts = run_sequential_team(topic=args.topic, output_path=args.output, use_mock=args.use_mock)
-
-        print(f"Completed. Verified facts: {len(facts)}. Report saved to {args.output}")
+        # uvloop.run (uvloop>=0.18) runs on a uvloop loop; otherwise use the stdlib loop
+        run = getattr(uvloop, "run", None) or asyncio.run
+        run(amain(args))
     except Exception as e:
         print("Error running team:", e)
         raise
@@ -1,11 +1,23 @@
 """Tavily client adapter implementing the `SearchTool` protocol used by the researcher.
 
-This adapter tries to use the official `tavily` SDK if installed, otherwise falls back to a simple
-HTTP-based implementation using `requests`.
+This adapter uses a simple HTTP-based implementation (`requests`, or `httpx` for `asearch`); set
+TAVILY_USE_SDK=1 to try the official `tavily` SDK first. Heavy dependencies (requests, redis, httpx,
+the SDK) are imported on first use, so importing this module stays cheap.
 
 Configuration (recommended via environment variables):
 - TAVILY_API_KEY: API key/token for Tavily (required for real requests)
 - TAVILY_API_BASE: Base URL for Tavily API (optional; adapter defaults to a common base)
+- TAVILY_LOCAL_CACHE_MAX: max entries kept in the in-process LRU cache (default 1024)
+- TAVILY_LOCAL_CACHE_TTL: entry lifetime in the in-process cache, in seconds (default: TAVILY_CACHE_TTL)
+- TAVILY_REDIS_MAX_CONN: connection cap of the shared Redis cache pool (default 32)
+- TAVILY_DISK_CACHE: directory of an on-disk cache shared across processes/CLI runs (optional;
+  requires `diskcache`, used when no Redis cache is configured)
+- TAVILY_DISK_CACHE_SIZE: size limit of the on-disk cache in bytes (default 1e9)
+- TAVILY_MAX_CONCURRENCY: max parallel requests issued by `search_many`/`asearch_many` (default 8)
+- TAVILY_BREAKER_FAIL_MAX / TAVILY_BREAKER_RESET: consecutive failed searches that open the circuit
+  breaker (default 5) and seconds before a trial request is let through again (default 30)
+- TAVILY_RETRY_AFTER_MAX: longest Retry-After (seconds) a 429 is waited out for; longer requests
+  fail the search immediately instead of parking a worker/semaphore slot (default 10)
 
 To use with the orchestration CLI, run:
     TAVILY_API_KEY=your_key python run_team.py --topic "..." --no-mock
@@ -13,39 +25,271 @@ To use with the orchestration CLI, run:
 NOTE: The exact fields returned by Tavily may differ; adjust parsing in `search` if needed.
 """
 from __future__ import annotations
+import asyncio
+import functools
+import hashlib
+import importlib
+import json
 import os
-from typing import List, Optional
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 import logging
 
 from crewai_agents import Source, SearchTool
 
 logger = logging.getLogger(__name__)
 
-# Try to import the SDK if available
+# requests/redis/httpx cost ~70ms each to import, so they load on first use via `_lazy`. They stay
+# reachable as module attributes (e.g. `tavily_adapter.requests`) so tests can monkeypatch them.
+_LAZY_MODULES = ("requests", "redis", "httpx")
+
+
+def _lazy(name: str):
+    """Return optional module `name` (None if not installed), importing it on first use."""
+    g = globals()
+    if name not in g:
+        try:
+            g[name] = importlib.import_module(name)
+        except Exception:
+            g[name] = None
+    return g[name]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Optional fast JSON codec for the Redis cache payloads (serializes dataclasses natively)
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# Optional incremental JSON parser used by `search_iter`
+try:
+    import ijson
+except Exception:
+    ijson = None
+
+# Optional compact Redis cache codec: msgpack + zstd (both required); JSON is used otherwise
 try:
-    import tavily  # type: ignore
-    _HAS_SDK = True
+    import msgpack
+    import zstandard
 except Exception:
-    tavily = None  # type: ignore
-    _HAS_SDK = False
+    msgpack = zstandard = None
 
-# Import requests at module level so tests can monkeypatch `tavily_adapter.requests` directly
+# Optional BLAKE3 for cache-key hashing; stdlib blake2b is used otherwise. Processes sharing a
+# Redis/disk cache should agree on this, since the two produce different keys.
 try:
-    import requests
+    from blake3 import blake3
 except Exception:
-    requests = None
+    blake3 = None
 
-# Import redis at module level so tests can monkeypatch `tavily_adapter.redis` directly
+# Optional persistent cache (SQLite-backed) so repeated CLI runs skip the network
 try:
-    import redis
+    import diskcache
 except Exception:
-    redis = None
+    diskcache = None
+
+# HTTP/2 for the `asearch` client is enabled when the `h2` extra is installed
+try:
+    import h2  # type: ignore  # noqa: F401
+    _HAS_H2 = True
+except Exception:
+    _HAS_H2 = False
 
 
 class TavilyError(Exception):
     pass
 
 
+class CircuitOpenError(TavilyError):
+    """Raised without contacting Tavily while the client's circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """Fail fast while the API is down.
+
+    CLOSED -> OPEN after `fail_max` consecutive failed searches (each already retried); while OPEN,
+    `check` raises CircuitOpenError. After `reset_timeout` seconds a single trial call is let
+    through (HALF_OPEN): success closes the circuit, another failure re-opens it.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"Tavily circuit open after {self._failures} consecutive failures")
+            # half-open: this caller is the trial; restart the window so others keep failing fast
+            self._opened_at = time.monotonic()
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+            else:
+                self._failures += 1
+                if self._failures >= self.fail_max:
+                    self._opened_at = time.monotonic()
+
+
+# upper bound for a single backoff sleep, however many retries are configured
+_BACKOFF_MAX = 5.0
+
+
+def _is_outage(status: int) -> bool:
+    # throttling and server errors count against the breaker; other 4xx mean the API is reachable
+    return status == 429 or status >= 500
+
+
+# Candidate response keys per Source field, in priority order (APIs/SDK versions differ)
+_TITLE_KEYS = ("title", "headline", "name")
+_URL_KEYS = ("url", "link", "uri")
+_SNIPPET_KEYS = ("snippet", "summary", "excerpt")
+_PUBLISHED_KEYS = ("published", "published_at", "date")
+
+
+def _pick(item: dict, keys: Sequence[str], default):
+    """Return the first truthy value among `keys` in `item`, else `default`."""
+    for k in keys:
+        v = item.get(k)
+        if v:
+            return v
+    return default
+
+
+# (Source field, candidate keys, default) driving both the generic and the generated parsers
+_FIELDS = (
+    ("title", _TITLE_KEYS, "Untitled"),
+    ("url", _URL_KEYS, None),
+    ("snippet", _SNIPPET_KEYS, ""),
+    ("published", _PUBLISHED_KEYS, None),
+)
+
+
+def _intern_url(url: Any) -> Any:
+    # the same URLs come back across topics, retries and cache reads; share one string object each
+    return sys.intern(url) if type(url) is str else url
+
+
+def _observe_schema(item: dict) -> Tuple[str, ...]:
+    """The key each Source field is read from in `item` (first candidate when none is present)."""
+    return tuple(next((k for k in keys if item.get(k)), keys[0]) for _, keys, _ in _FIELDS)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_parser(schema: Tuple[str, ...]) -> Callable[[Any], List[Source]]:
+    """Generate a parser specialized to `schema`: each field is one direct `.get` of its observed
+    key, and the generic `_pick` scan only runs for rows where that key is missing or empty.
+    """
+    ns: Dict[str, Any] = {"Source": Source, "_pick": _pick, "_intern_url": _intern_url}
+    args = []
+    for n, ((name, keys, default), key) in enumerate(zip(_FIELDS, schema)):
+        ns[f"_K{n}"] = keys
+        expr = f"i.get({key!r}) or _pick(i, _K{n}, {default!r})"
+        args.append(f"{name}=_intern_url({expr})" if name == "url" else f"{name}={expr}")
+    src = (
+        "def _parse_fast(results):\n"
+        f"    return [Source({', '.join(args)}, metadata=i) for i in results if isinstance(i, dict)]\n"
+    )
+    exec(compile(src, f"<tavily parser {'/'.join(schema)}>", "exec"), ns)
+    return ns["_parse_fast"]
+
+
+def _retry_after(r) -> Optional[float]:
+    """Seconds requested by a response's Retry-After header (delta-seconds form), if any."""
+    try:
+        return max(0.0, float(r.headers["Retry-After"]))
+    except Exception:
+        return None
+
+
+def _iter_result_items(stream):
+    """Yield result items from a streamed payload, either {"results": [...]} or a top-level list."""
+    events = ijson.parse(stream, use_float=True)
+    try:
+        _, event, _ = next(events)
+    except StopIteration:
+        return
+    yield from ijson.items(events, "item" if event == "start_array" else "results.item")
+
+
+# Redis connection pools shared by every TavilyClient using the same cache URL
+_REDIS_POOLS: Dict[str, Any] = {}
+_REDIS_POOLS_LOCK = threading.Lock()
+
+
+def _redis_client(url: str):
+    """Return a Redis client backed by the shared per-URL connection pool."""
+    redis = _lazy("redis")
+    with _REDIS_POOLS_LOCK:
+        pool = _REDIS_POOLS.get(url)
+        if pool is None:
+            # raw bytes in/out: payloads are encoded/decoded by _encode_results/_decode_results
+            pool = redis.ConnectionPool.from_url(url, max_connections=int(os.environ.get("TAVILY_REDIS_MAX_CONN", "32")))
+            _REDIS_POOLS[url] = pool
+    return redis.Redis(connection_pool=pool)
+
+
+# Leading byte of versioned cache payloads. Plain JSON entries start with "[" and carry no tag,
+# so entries written before the tag existed (or without msgpack/zstd installed) still decode.
+_CODEC_MSGPACK_ZSTD = 0x01
+_ZSTD_LEVEL = 3
+
+
+def _encode_results(value: List[Any]) -> bytes:
+    """Serialize cached search results (Source dataclasses or plain items) for Redis.
+
+    With msgpack and zstandard installed the payload is a version byte followed by zstd
+    (level 3) compressed msgpack, several times smaller than JSON for snippet-heavy results.
+    """
+    if msgpack is not None:
+        packed = msgpack.packb([asdict(v) if is_dataclass(v) else v for v in value], default=str)
+        return bytes((_CODEC_MSGPACK_ZSTD,)) + zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(packed)
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps([asdict(v) if is_dataclass(v) else v for v in value], default=str).encode()
+
+
+def _decode_results(raw) -> List[Any]:
+    if raw[:1] == bytes((_CODEC_MSGPACK_ZSTD,)):
+        if msgpack is None:
+            raise TavilyError("cached entry needs msgpack and zstandard to decode")
+        loaded = msgpack.unpackb(zstandard.ZstdDecompressor().decompress(raw[1:]))
+    else:
+        loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    # Convert back to Source objects if possible
+    return [
+        Source(**{**item, "url": _intern_url(item["url"])}) if isinstance(item, dict) and "title" in item and "url" in item else item
+        for item in loaded
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _cache_key_impl(topic: str, limit: int) -> str:
+    # Fixed-size key however long the topic; case/whitespace variants share one entry. Memoized:
+    # agent loops repeat the same queries, so most calls skip normalizing and hashing.
+    data = topic.strip().lower().encode()
+    digest = blake3(data).hexdigest()[:16] if blake3 is not None else hashlib.blake2b(data, digest_size=8).hexdigest()
+    return f"tavily:{digest}:{limit}"
+
+
 class TavilyClient(SearchTool):
     def __init__(
         self,
@@ -63,6 +307,9 @@ class TavilyClient(SearchTool):
         self.cache_ttl = int(os.environ.get("TAVILY_CACHE_TTL", str(cache_ttl)))
         self.max_retries = int(os.environ.get("TAVILY_MAX_RETRIES", str(max_retries)))
         self.backoff_factor = float(os.environ.get("TAVILY_BACKOFF_FACTOR", str(backoff_factor)))
+        # Per-request constants, built once (the async client gets the same headers)
+        self._search_url = f"{self.base_url.rstrip('/')}/search"
+        self._headers = {"Authorization": f"Bearer {self.api_key}", "Accept": "application/json"}
         # Redis cache URL may be passed explicitly or via env
         self.redis_cache_url = redis_cache_url or os.environ.get("TAVILY_REDIS_CACHE_URL")
 
@@ -73,62 +320,111 @@ class TavilyClient(SearchTool):
         # If redis cache URL provided, try to instantiate a redis client for shared caching
         self._redis_cache = None
         if self.redis_cache_url:
-            if redis is None:
+            if _lazy("redis") is None:
                 logger.warning("redis package not available; redis cache disabled")
             else:
                 try:
-                    self._redis_cache = redis.from_url(self.redis_cache_url, decode_responses=True)
+                    self._redis_cache = _redis_client(self.redis_cache_url)
                 except Exception as e:
                     logger.warning("Failed to connect to redis cache, disabling redis cache: %s", e)
 
-        # SDK detection
-        if _HAS_SDK:
+        # Optional on-disk cache for when Redis isn't configured; survives across processes
+        self._disk = None
+        disk_dir = os.environ.get("TAVILY_DISK_CACHE")
+        if disk_dir and self._redis_cache is None:
+            if diskcache is None:
+                logger.warning("diskcache package not available; disk cache disabled")
+            else:
+                try:
+                    self._disk = diskcache.Cache(disk_dir, size_limit=int(float(os.environ.get("TAVILY_DISK_CACHE_SIZE", "1e9"))))
+                except Exception as e:
+                    logger.warning("Failed to open disk cache, disabling disk cache: %s", e)
+
+        # Optional SDK client (opt-in: importing/instantiating it is slow and its API varies by version)
+        self._client = None
+        self._use_sdk = False
+        if os.environ.get("TAVILY_USE_SDK") == "1":
             try:
-                # Try to instantiate the SDK client. The exact SDK constructor may vary; adapt if needed.
+                import tavily  # type: ignore
+                # The exact SDK constructor may vary; adapt if needed.
                 self._client = tavily.Client(api_key=self.api_key, base_url=self.base_url)
                 self._use_sdk = True
             except Exception as e:
                 logger.warning("Failed to instantiate tavily SDK client; falling back to HTTP: %s", e)
-                self._client = None
-                self._use_sdk = False
-        else:
-            self._client = None
-            self._use_sdk = False
-
-        # HTTP session with retries/backoff
-        try:
-            # use module-level `requests` when available
-            if requests is None:
-                raise RuntimeError("requests package not available")
-            from requests.adapters import HTTPAdapter
-            from urllib3.util import Retry
-
-            self._session = requests.Session()
-            retry_strategy = Retry(
-                total=self.max_retries,
-                backoff_factor=self.backoff_factor,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "POST"],
-                raise_on_status=False,
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            self._session.mount("https://", adapter)
-            self._session.mount("http://", adapter)
-        except Exception as e:
-            logger.warning("requests/Retry not available; HTTP retries disabled: %s", e)
-            self._session = None
 
-        # Simple in-memory cache: {cache_key: (timestamp, results)}
-        self._cache: dict = {}
+        # Keep-alive HTTP session used by `_http_get` (built on first use, see `_get_session`)
+        self._session = None
+
+        self._breaker = _CircuitBreaker(
+            fail_max=int(os.environ.get("TAVILY_BREAKER_FAIL_MAX", "5")),
+            reset_timeout=float(os.environ.get("TAVILY_BREAKER_RESET", "30")),
+        )
+
+        self._retry_after_max = float(os.environ.get("TAVILY_RETRY_AFTER_MAX", "10"))
+
+        # Shared async HTTP client (created lazily, per event loop) used by `asearch`
+        self._aclient = None
+        self._aclient_loop = None
+        # task on the client's loop that closes it when cancelled (see `_close_aclient_on_cancel`)
+        self._aclient_closer: Optional[asyncio.Task] = None
+        # Parser specialized to the response schema, generated on the first parse (see `_parse`)
+        self._parse_fast: Optional[Callable[[Any], List[Source]]] = None
+        # Single-flight map for `asearch`: {cache_key: task} of fetches currently in progress
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # In-process LRU cache: {cache_key: (monotonic timestamp, results)}, most recent last.
+        # The lock keeps move_to_end/popitem consistent when search_many runs searches in threads.
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_max = int(os.environ.get("TAVILY_LOCAL_CACHE_MAX", "1024"))
+        self._cache_local_ttl = int(os.environ.get("TAVILY_LOCAL_CACHE_TTL", str(self.cache_ttl)))
+        self._cache_lock = threading.Lock()
         # Simple cache metrics
         self._cache_hits = 0
         self._cache_misses = 0
 
+    def _get_session(self):
+        # Keep-alive connection pool for `_http_get`. Retries are left to `_http_get`'s own loop
+        # (so Retry-After capping and circuit-breaker accounting happen in one place), hence no
+        # urllib3 Retry on the adapter.
+        if self._session is None:
+            try:
+                requests = _lazy("requests")
+                if requests is None:
+                    raise RuntimeError("requests package not available")
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            except Exception as e:
+                logger.warning("requests session not available; using one-off connections: %s", e)
+        return self._session
+
     def get_cache_metrics(self):
         return {"hits": self._cache_hits, "misses": self._cache_misses}
 
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: concurrent clients spread their retries instead of hitting the API in lockstep
+        return random.uniform(0, min(_BACKOFF_MAX, self.backoff_factor * (2 ** attempt)))
+
+    def _rate_limit_delay(self, r, attempt: int) -> float:
+        """Seconds to wait before retrying a 429: the server's Retry-After (else the backoff).
+
+        A Retry-After beyond TAVILY_RETRY_AFTER_MAX fails the search right away (counted by the
+        circuit breaker) rather than blocking the caller for that long.
+        """
+        delay = _retry_after(r)
+        if delay is None:
+            return self._backoff(attempt)
+        if delay > self._retry_after_max:
+            self._breaker.record(ok=False)
+            raise TavilyError(f"Tavily rate limited; Retry-After {delay:g}s exceeds {self._retry_after_max:g}s")
+        return delay
+
     def _cache_key(self, topic: str, limit: int) -> str:
-        return f"tavily:{topic}:{limit}"
+        return _cache_key_impl(topic, limit)
 
     def _get_cached(self, key: str):
         # Try Redis shared cache first if available
@@ -138,75 +434,94 @@ class TavilyClient(SearchTool):
                 if v is None:
                     self._cache_misses += 1
                     return None
-                import json
-
-                loaded = json.loads(v)
-                # Convert back to Source objects if possible
-                out = []
-                for item in loaded:
-                    if isinstance(item, dict) and "title" in item and "url" in item:
-                        out.append(Source(**item))
-                    else:
-                        out.append(item)
+                out = _decode_results(v)
                 self._cache_hits += 1
                 return out
             except Exception as e:
                 logger.warning("Redis cache get failed, falling back to local cache: %s", e)
                 self._cache_misses += 1
 
-        entry = self._cache.get(key)
-        if not entry:
-            self._cache_misses += 1
-            return None
-        ts, value = entry
-        import time
-
-        if (time.time() - ts) > self.cache_ttl:
-            # expired
-            del self._cache[key]
-            self._cache_misses += 1
-            return None
-        self._cache_hits += 1
-        return value
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry:
+                ts, value = entry
+                # monotonic clock: immune to wall-clock (NTP) jumps
+                if (time.monotonic() - ts) <= self._cache_local_ttl:
+                    self._cache.move_to_end(key)
+                    self._cache_hits += 1
+                    return value
+                # expired
+                del self._cache[key]
+
+        # Disk cache entries carry their own expiry, so a hit here is still fresh
+        if self._disk is not None:
+            try:
+                value = self._disk.get(key)
+            except Exception as e:
+                logger.warning("Disk cache get failed: %s", e)
+                value = None
+            if value is not None:
+                self._cache_hits += 1
+                return value
+
+        self._cache_misses += 1
+        return None
+
+    def _get_cached_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Look up several keys at once; Redis GETs are pipelined into one round-trip.
+
+        Returns {key: value} for hits only.
+        """
+        if self._redis_cache is not None and keys:
+            try:
+                pipe = self._redis_cache.pipeline(transaction=False)
+                for k in keys:
+                    pipe.get(k)
+                raws = pipe.execute()
+                out = {k: _decode_results(raw) for k, raw in zip(keys, raws) if raw is not None}
+                self._cache_hits += len(out)
+                self._cache_misses += len(keys) - len(out)
+                return out
+            except Exception as e:
+                logger.warning("Redis cache pipelined get failed, falling back to per-key lookups: %s", e)
+        out = {}
+        for k in keys:
+            v = self._get_cached(k)
+            if v is not None:
+                out[k] = v
+        return out
 
     def _set_cache(self, key: str, value):
         # Try Redis shared cache first if available
         if self._redis_cache is not None:
             try:
-                import json
-                # Convert Source objects to serializable dicts
-                serializable = []
-                for item in value:
-                    if hasattr(item, "__dict__") or hasattr(item, "__dataclass_fields__"):
-                        # convert dataclass-like objects
-                        try:
-                            serializable.append(item.__dict__)
-                        except Exception:
-                            # fallback to asdict if dataclass
-                            from dataclasses import asdict
-
-                            try:
-                                serializable.append(asdict(item))
-                            except Exception:
-                                serializable.append(str(item))
-                    else:
-                        serializable.append(item)
-
-                self._redis_cache.setex(key, int(self.cache_ttl), json.dumps(serializable))
+                self._redis_cache.set(key, _encode_results(value), ex=int(self.cache_ttl))
                 return
             except Exception as e:
                 logger.warning("Redis cache set failed, falling back to local cache: %s", e)
 
-        import time
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_max:
+                # evict least recently used
+                self._cache.popitem(last=False)
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value, expire=self.cache_ttl)
+            except Exception as e:
+                logger.warning("Disk cache set failed: %s", e)
 
-        self._cache[key] = (time.time(), value)
     def search(self, topic: str, limit: int = 10) -> List[Source]:
         cache_k = self._cache_key(topic, limit)
         cached = self._get_cached(cache_k)
         if cached is not None:
             logger.debug("TavilyClient: returning cached results for %s", topic)
             return cached
+        return self._fetch(topic, limit, cache_k)
 
+    def _fetch(self, topic: str, limit: int, cache_k: str) -> List[Source]:
+        """Uncached search: query Tavily, then populate the cache."""
         # Try SDK path first
         if self._use_sdk and self._client is not None:
             try:
@@ -217,7 +532,9 @@ class TavilyClient(SearchTool):
                     resp = self._client.search_documents(topic, limit=limit)
                 else:
                     raise TavilyError("Tavily SDK present but search method not detected. Please adapt TavilyClient to your SDK.")
-                results = self._parse_results(resp)
+                # SDKs return either {"results": [...]} or a bare list; anything else raises
+                # TavilyError and falls back to HTTP
+                results = self._parse(self._results_from_payload(resp))
                 self._set_cache(cache_k, results)
                 return results
             except Exception as e:
@@ -225,50 +542,99 @@ class TavilyClient(SearchTool):
                 # continue to HTTP fallback
 
         # HTTP fallback
+        r = self._http_get(topic, limit)
         try:
-            import requests
-        except Exception:
+            data = r.json()
+        except Exception as e:
+            raise TavilyError(f"HTTP search failed: {e}")
+
+        parsed = self._parse(self._results_from_payload(data))
+        self._set_cache(cache_k, parsed)
+        return parsed
+
+    def _http_get(self, topic: str, limit: int, **kwargs):
+        """GET the search endpoint with retries; returns the response or raises TavilyError."""
+        requests = _lazy("requests")
+        if requests is None:
             raise TavilyError("requests package is required for HTTP fallback")
 
-        url = f"{self.base_url.rstrip('/')}/search"
-        headers = {"Authorization": f"Bearer {self.api_key}", "Accept": "application/json"}
+        url = self._search_url
+        headers = self._headers
         params = {"q": topic, "limit": limit}
 
+        self._breaker.check()
         try:
-            # Prefer module-level requests.get so tests can monkeypatch it; fall back to session if absent
-            if requests is not None:
-                # Use simple retry loop calling module-level requests.get so tests can control behavior
-                import time
-                last_exc = None
-                attempts = max(1, self.max_retries + 1)
-                for attempt in range(attempts):
-                    try:
-                        r = requests.get(url, headers=headers, params=params, timeout=self.timeout)
-                        # If we got a response object, break
-                        break
-                    except Exception as e:
-                        last_exc = e
-                        # backoff (only sleep if backoff_factor > 0)
-                        if self.backoff_factor and attempt < attempts - 1:
-                            time.sleep(self.backoff_factor * (2 ** attempt))
-                        continue
-                else:
-                    # all attempts exhausted
-                    raise TavilyError(f"HTTP search failed after retries: {last_exc}")
-            elif self._session is not None:
-                r = self._session.get(url, headers=headers, params=params, timeout=self.timeout)
+            # Requests go through the pooled session (module-level requests.get if it couldn't be
+            # built). Only transient network errors are retried; anything else (bad URL, 4xx) fails at once.
+            transport = self._get_session() or requests
+            retryable = (requests.ConnectionError, requests.Timeout)
+            last_exc = None
+            attempts = max(1, self.max_retries + 1)
+            for attempt in range(attempts):
+                try:
+                    r = transport.get(url, headers=headers, params=params, timeout=self.timeout, **kwargs)
+                except retryable as e:
+                    last_exc = e
+                    # backoff (only sleep if backoff_factor > 0)
+                    if self.backoff_factor and attempt < attempts - 1:
+                        time.sleep(self._backoff(attempt))
+                    continue
+                # rate limited: wait as long as the server asks (else back off) and retry
+                if getattr(r, "status_code", 200) == 429 and attempt < attempts - 1:
+                    time.sleep(self._rate_limit_delay(r, attempt))
+                    continue
+                # If we got a response object, break
+                break
             else:
-                raise TavilyError("requests package required for HTTP fallback")
+                # all attempts exhausted
+                self._breaker.record(ok=False)
+                raise TavilyError(f"HTTP search failed after retries: {last_exc}")
 
+            self._breaker.record(ok=not _is_outage(getattr(r, "status_code", 200)))
             # If status code indicates error, try to provide helpful message
             if getattr(r, "status_code", 200) >= 400:
                 raise TavilyError(f"Tavily HTTP error: {getattr(r, 'status_code', 'unknown')} - {getattr(r, 'text', '')}")
-            data = r.json()
         except TavilyError:
             raise
         except Exception as e:
             raise TavilyError(f"HTTP search failed: {e}")
+        return r
 
+    def search_iter(self, topic: str, limit: int = 10) -> Iterator[Source]:
+        """Like `search`, but yields Sources while the HTTP response is still streaming in.
+
+        Items are parsed incrementally with `ijson`, so callers can start work on the first
+        results before the body completes and whole payloads are never materialized. The full
+        list is cached once the stream is exhausted. Falls back to `search` when ijson is not
+        installed or the SDK is in use.
+        """
+        cache_k = self._cache_key(topic, limit)
+        cached = self._get_cached(cache_k)
+        if cached is not None:
+            yield from cached
+            return
+        if ijson is None or (self._use_sdk and self._client is not None):
+            yield from self._fetch(topic, limit, cache_k)
+            return
+
+        r = self._http_get(topic, limit, stream=True)
+        # requests only decodes gzip/deflate in iter_content/.content; the raw urllib3 stream
+        # hands out the encoded bytes unless asked to decode
+        r.raw.decode_content = True
+        results: List[Source] = []
+        try:
+            for item in _iter_result_items(r.raw):
+                for src in self._parse((item,)):
+                    results.append(src)
+                    yield src
+        except ijson.JSONError as e:
+            raise TavilyError(f"HTTP search failed: {e}")
+        finally:
+            r.close()
+        self._set_cache(cache_k, results)
+
+    @staticmethod
+    def _results_from_payload(data) -> list:
         # Expect `data` to contain a `results` list; adapt if the real API differs
         results = data.get("results") if isinstance(data, dict) else None
         if results is None:
@@ -277,20 +643,184 @@ class TavilyClient(SearchTool):
                 results = data
             else:
                 raise TavilyError("Unexpected search response format from Tavily API (no 'results' list)")
+        return results
+
+    def _get_aclient(self):
+        # httpx pools are bound to the loop that created them, so rebuild if the loop changed
+        httpx = _lazy("httpx")
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            stale_loop, stale_closer = self._aclient_loop, self._aclient_closer
+            if stale_closer is not None and not stale_loop.is_closed():
+                # the old client can only be closed on its own loop; it runs the close when next active
+                stale_loop.call_soon_threadsafe(stale_closer.cancel)
+            self._aclient = httpx.AsyncClient(
+                http2=_HAS_H2,
+                timeout=self.timeout,
+                headers=self._headers,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+            self._aclient_loop = loop
+            self._aclient_closer = loop.create_task(self._close_aclient_on_cancel(self._aclient))
+        return self._aclient
 
-        parsed = self._parse_results(results)
+    @staticmethod
+    async def _close_aclient_on_cancel(client) -> None:
+        # Parked until cancelled, then closes `client`. asyncio.run/uvloop.run cancel leftover tasks
+        # before closing the loop, so a client whose owner never awaited `aclose` is still closed.
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client (call before the event loop shuts down)."""
+        client, closer = self._aclient, self._aclient_closer
+        self._aclient = self._aclient_loop = self._aclient_closer = None
+        if closer is not None and closer.get_loop() is asyncio.get_running_loop():
+            closer.cancel()
+            await asyncio.gather(closer, return_exceptions=True)
+        if client is not None:
+            # closing twice is a no-op; needed when the closer was cancelled before it ever ran
+            await client.aclose()
+
+    async def asearch(self, topic: str, limit: int = 10) -> List[Source]:
+        """Awaitable `search` over a shared keep-alive `httpx.AsyncClient` (HTTP/2 when available).
+
+        Falls back to running the blocking `search` in a worker thread when httpx is missing
+        or the SDK path is in use.
+        """
+        cache_k = self._cache_key(topic, limit)
+        cached = self._get_cached(cache_k)
+        if cached is not None:
+            logger.debug("TavilyClient: returning cached results for %s", topic)
+            return cached
+        return await self._afetch_shared(topic, limit, cache_k)
+
+    async def _afetch_shared(self, topic: str, limit: int, cache_k: str) -> List[Source]:
+        """Single-flight `_afetch`: concurrent callers for the same key await one request."""
+        # no await between the lookup and the insert, so this is atomic on the event loop
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(cache_k)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._afetch(topic, limit, cache_k))
+            self._inflight[cache_k] = task
+            task.add_done_callback(lambda t: self._inflight.pop(cache_k, None) if self._inflight.get(cache_k) is t else None)
+        # shield: one caller being cancelled must not cancel the fetch the others are waiting on
+        return await asyncio.shield(task)
+
+    async def _afetch(self, topic: str, limit: int, cache_k: str) -> List[Source]:
+        httpx = _lazy("httpx")
+        if httpx is None or (self._use_sdk and self._client is not None):
+            return await asyncio.to_thread(self._fetch, topic, limit, cache_k)
+
+        client = self._get_aclient()
+        url = self._search_url
+        params = {"q": topic, "limit": limit}
+        self._breaker.check()
+        last_exc = None
+        attempts = max(1, self.max_retries + 1)
+        for attempt in range(attempts):
+            try:
+                r = await client.get(url, params=params)
+            except httpx.TransportError as e:
+                last_exc = e
+                # non-blocking backoff so other searches keep progressing
+                if self.backoff_factor and attempt < attempts - 1:
+                    await asyncio.sleep(self._backoff(attempt))
+                continue
+            except Exception as e:
+                # not retried, but reported like the sync path: as TavilyError, counted by the breaker
+                self._breaker.record(ok=False)
+                raise TavilyError(f"HTTP search failed: {e}") from e
+            if r.status_code == 429 and attempt < attempts - 1:
+                await asyncio.sleep(self._rate_limit_delay(r, attempt))
+                continue
+            break
+        else:
+            self._breaker.record(ok=False)
+            raise TavilyError(f"HTTP search failed after retries: {last_exc}")
+
+        self._breaker.record(ok=not _is_outage(r.status_code))
+        if r.status_code >= 400:
+            raise TavilyError(f"Tavily HTTP error: {r.status_code} - {r.text}")
+        try:
+            data = r.json()
+        except Exception as e:
+            raise TavilyError(f"HTTP search failed: {e}")
+
+        parsed = self._parse(self._results_from_payload(data))
         self._set_cache(cache_k, parsed)
         return parsed
 
+    async def asearch_many(self, topics: Sequence[str], limit: int = 10) -> Dict[str, List[Source]]:
+        """Async `search_many`: cached topics come from one pipelined cache lookup; the rest are
+        in flight together on the shared async client (multiplexed over one connection with
+        HTTP/2), bounded by TAVILY_MAX_CONCURRENCY.
+        """
+        unique = list(dict.fromkeys(topics))
+        keys = {t: self._cache_key(t, limit) for t in unique}
+        cached = self._get_cached_many(list(keys.values()))
+        sem = asyncio.Semaphore(int(os.environ.get("TAVILY_MAX_CONCURRENCY", "8")))
+
+        async def _one(topic: str) -> List[Source]:
+            if keys[topic] in cached:
+                return cached[keys[topic]]
+            async with sem:
+                return await self._afetch_shared(topic, limit, keys[topic])
+
+        results = await asyncio.gather(*(_one(t) for t in unique))
+        return dict(zip(unique, results))
+
+    def search_many(self, topics: Sequence[str], limit: int = 10) -> Dict[str, List[Source]]:
+        """Search several topics concurrently; returns {topic: results} in first-seen topic order.
+
+        Cached topics come from one pipelined cache lookup; the remaining topics are fetched on a
+        bounded thread pool, making a batch take roughly the slowest request rather than the sum.
+        """
+        unique = list(dict.fromkeys(topics))
+        keys = {t: self._cache_key(t, limit) for t in unique}
+        out: Dict[str, List[Source]] = {}
+        cached = self._get_cached_many(list(keys.values()))
+        missing = [t for t in unique if keys[t] not in cached]
+        fetched: Dict[str, List[Source]] = {}
+        if len(missing) == 1:
+            fetched[missing[0]] = self._fetch(missing[0], limit, keys[missing[0]])
+        elif missing:
+            workers = min(len(missing), int(os.environ.get("TAVILY_MAX_CONCURRENCY", "8")))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                fetched = dict(zip(missing, ex.map(lambda t: self._fetch(t, limit, keys[t]), missing)))
+        for t in unique:
+            out[t] = cached[keys[t]] if keys[t] in cached else fetched[t]
+        return out
+
+    def _parse(self, results) -> List[Source]:
+        """`_parse_results` specialized to the key names seen in the first response."""
+        if isinstance(results, dict):
+            # a whole payload, not its result rows: iterating it would silently yield nothing
+            raise TavilyError("expected a list of results; pass payloads through _results_from_payload")
+        parse = self._parse_fast
+        if parse is None:
+            if not isinstance(results, (list, tuple)):
+                return self._parse_results(results)
+            sample = next((i for i in results if isinstance(i, dict)), None)
+            if sample is None:
+                return []
+            parse = self._parse_fast = _compile_parser(_observe_schema(sample))
+        return parse(results)
+
     @staticmethod
     def _parse_results(results) -> List[Source]:
-        out: List[Source] = []
-        for item in results[:]:
-            if not isinstance(item, dict):
-                continue
-            title = item.get("title") or item.get("headline") or item.get("name") or "Untitled"
-            url = item.get("url") or item.get("link") or item.get("uri")
-            snippet = item.get("snippet") or item.get("summary") or item.get("excerpt") or ""
-            published = item.get("published") or item.get("published_at") or item.get("date")
-            out.append(Source(title=title, url=url, snippet=snippet, published=published, metadata=item))
-        return out
+        if isinstance(results, dict):
+            raise TavilyError("expected a list of results; pass payloads through _results_from_payload")
+        return [
+            Source(
+                title=_pick(item, _TITLE_KEYS, "Untitled"),
+                url=_intern_url(_pick(item, _URL_KEYS, None)),
+                snippet=_pick(item, _SNIPPET_KEYS, ""),
+                published=_pick(item, _PUBLISHED_KEYS, None),
+                metadata=item,
+            )
+            for item in results
+            if isinstance(item, dict)
+        ]
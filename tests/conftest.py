@@ -0,0 +1,107 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_spacy():
+    """Load the (lazily loaded) spaCy model once up front instead of inside the first NER test."""
+    import crewai_agents_helpers
+
+    crewai_agents_helpers._get_nlp()
+
+
+@pytest.fixture
+def tavily_http(monkeypatch):
+    """Intercept `requests` traffic with `responses`; register Tavily payloads on `SEARCH_URL`."""
+    responses = pytest.importorskip("responses")
+    monkeypatch.setenv("TAVILY_API_KEY", "testkey")
+    monkeypatch.delenv("TAVILY_API_BASE", raising=False)
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+@pytest.fixture
+def tavily_server(monkeypatch):
+    """A real local HTTP server standing in for Tavily, for paths `responses` doesn't model
+    faithfully (e.g. the raw urllib3 stream `search_iter` reads). Set `.body`/`.headers` to
+    shape the reply; `.paths` records the requested paths."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.paths.append(self.path)
+            self.send_response(200)
+            for name, value in {"Content-Type": "application/json", **server.headers}.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(server.body)))
+            self.end_headers()
+            self.wfile.write(server.body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.body, server.headers, server.paths = b"{}", {}, []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("TAVILY_API_KEY", "testkey")
+    monkeypatch.setenv("TAVILY_API_BASE", f"http://127.0.0.1:{server.server_address[1]}")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def _module_tavily_client():
+    """One TavilyClient per test module, built against the test API key and default endpoint."""
+    from tavily_adapter import TavilyClient
+
+    mp = pytest.MonkeyPatch()
+    mp.setenv("TAVILY_API_KEY", "testkey")
+    mp.delenv("TAVILY_API_BASE", raising=False)
+    client = TavilyClient(backoff_factor=0)
+    yield client
+    mp.undo()
+
+
+@pytest.fixture
+def tavily_client(_module_tavily_client):
+    """The module's shared TavilyClient, with its local cache and breaker reset after each test."""
+    client = _module_tavily_client
+    yield client
+    with client._cache_lock:
+        client._cache.clear()
+    client._cache_hits = client._cache_misses = 0
+    client._breaker.record(ok=True)
+
+
+@pytest.fixture(scope="session")
+def fake_server():
+    """One in-process fakeredis server for the whole run; per-test fixtures flush it afterwards."""
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def fake_redis(fake_server):
+    """Raw-bytes client on the shared fake server (the Tavily cache stores encoded bytes)."""
+    import fakeredis
+
+    client = fakeredis.FakeRedis(server=fake_server)
+    yield client
+    client.flushall()
+
+
+@pytest.fixture
+def fake_redis_pool(fake_server):
+    """Decoding connection pool on the shared fake server, shaped like `agents_core._get_pool`."""
+    import fakeredis
+    import redis
+
+    pool = redis.ConnectionPool(
+        connection_class=getattr(fakeredis, "FakeRedisConnection", fakeredis.FakeConnection),
+        server=fake_server,
+        decode_responses=True,
+    )
+    yield pool
+    redis.Redis(connection_pool=pool).flushall()
+    pool.disconnect()
@@ -37,3 +37,122 @@ def test_end_to_end_creates_file(tmp_path):
     assert out.exists()
     assert isinstance(facts, list)
     assert md.startswith("# Research Report")
+
+
+def test_analyst_run_batch_matches_single_runs():
+    client = MockTavilyClient()
+    analyst = SeniorResearchAnalyst(search_tool=client, search_limit=6, top_k=6)
+    batch = analyst.run_batch(["Topic A", "Topic B", "Topic A"])
+    assert list(batch) == ["Topic A", "Topic B"]
+    for topic, facts in batch.items():
+        assert [f.claim for f in facts] == [f.claim for f in analyst.run(topic)]
+
+
+def test_run_parallel_team_writes_report_per_topic(tmp_path):
+    import asyncio
+    from crewai_agents import run_parallel_team, report_path_for_topic
+
+    out = tmp_path / "report.md"
+    results = asyncio.run(run_parallel_team(["Topic A", "Topic B"], output_path=str(out), use_mock=True))
+    assert list(results) == ["Topic A", "Topic B"]
+    for topic, (md, facts) in results.items():
+        path = tmp_path / f"report_{topic.lower().replace(' ', '_')}.md"
+        assert report_path_for_topic(str(out), topic) == str(path)
+        assert path.read_text() == md
+        assert facts
+
+
+def test_async_writer_drafts_facts_concurrently():
+    import asyncio
+    from crewai_agents import AsyncTechnicalContentWriter
+
+    class CountingLLM:
+        def __init__(self):
+            self.active = self.peak = 0
+
+        async def agenerate(self, prompt, **kwargs):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return "DRAFT " + prompt.rsplit("Claim: ", 1)[1]
+
+    client = MockTavilyClient()
+    facts = SeniorResearchAnalyst(search_tool=client, search_limit=6, top_k=6).run("Test Topic")
+    llm = CountingLLM()
+    writer = AsyncTechnicalContentWriter(llm=llm, max_concurrency=2)
+    md = asyncio.run(writer.asynthesize("Test Topic", facts))
+
+    assert 1 < llm.peak <= 2 if len(facts) > 1 else llm.peak == 1
+    for vf in facts:
+        assert f"DRAFT {vf.claim}" in md
+    # without drafts the report matches the synchronous writer
+    assert asyncio.run(AsyncTechnicalContentWriter().asynthesize("Test Topic", facts)) == writer.synthesize("Test Topic", facts)
+
+
+def test_run_parallel_team_caps_topics_in_flight(tmp_path):
+    import asyncio
+    from crewai_agents import run_parallel_team
+
+    class SlowSearch(MockTavilyClient):
+        active = peak = 0
+
+        async def asearch(self, topic, limit=10):
+            SlowSearch.active += 1
+            SlowSearch.peak = max(SlowSearch.peak, SlowSearch.active)
+            await asyncio.sleep(0.01)
+            SlowSearch.active -= 1
+            return self.search(topic, limit)
+
+    topics = [f"Topic {i}" for i in range(5)]
+    results = asyncio.run(run_parallel_team(topics, output_path=str(tmp_path / "r.md"), search_tool=SlowSearch(), max_concurrency=2))
+    assert list(results) == topics
+    assert SlowSearch.peak == 2
+
+
+def test_async_writer_reuses_cached_drafts():
+    import asyncio
+    from agents_core import InMemoryMemory
+    from crewai_agents import AsyncTechnicalContentWriter
+
+    class CountingLLM:
+        calls = 0
+
+        async def agenerate(self, prompt, **kwargs):
+            CountingLLM.calls += 1
+            return "DRAFT " + prompt.rsplit("Claim: ", 1)[1]
+
+    facts = SeniorResearchAnalyst(search_tool=MockTavilyClient(), search_limit=6, top_k=6).run("Test Topic")
+    memory = InMemoryMemory()
+    first = asyncio.run(AsyncTechnicalContentWriter(llm=CountingLLM(), memory=memory).asynthesize("Test Topic", facts))
+    calls = CountingLLM.calls
+    assert calls == len(facts)
+    # a second run (e.g. a new CLI invocation sharing the memory backend) skips the LLM
+    second = asyncio.run(AsyncTechnicalContentWriter(llm=CountingLLM(), memory=memory).asynthesize("Test Topic", facts))
+    assert second == first
+    assert CountingLLM.calls == calls
+    # a different topic is a different key
+    asyncio.run(AsyncTechnicalContentWriter(llm=CountingLLM(), memory=memory).asynthesize("Other Topic", facts))
+    assert CountingLLM.calls == 2 * calls
+
+
+def test_analyst_run_async_verifies_off_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    analyst = SeniorResearchAnalyst(search_tool=MockTavilyClient())
+    verify = analyst.verify_facts
+    threads = []
+
+    def recording_verify(sources, **kwargs):
+        threads.append(threading.get_ident())
+        return verify(sources, **kwargs)
+
+    monkeypatch.setattr(analyst, "verify_facts", recording_verify)
+
+    async def go():
+        return threading.get_ident(), await analyst.run_async("Quantum Computing")
+
+    loop_thread, facts = asyncio.run(go())
+    assert facts == SeniorResearchAnalyst(search_tool=MockTavilyClient()).run("Quantum Computing")
+    assert threads and threads[0] != loop_thread
@@ -13,3 +13,75 @@ def test_cache_metrics_local_cache():
     _ = client._get_cached(key)
     metrics = client.get_cache_metrics()
     assert metrics["hits"] >= 1
+
+
+def test_local_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setenv("TAVILY_LOCAL_CACHE_MAX", "2")
+    client = TavilyClient()
+    client._set_cache("a", ["A"])
+    client._set_cache("b", ["B"])
+    assert client._get_cached("a") == ["A"]  # touch "a" so "b" becomes the LRU entry
+    client._set_cache("c", ["C"])
+    assert client._get_cached("b") is None
+    assert client._get_cached("a") == ["A"]
+    assert client._get_cached("c") == ["C"]
+
+
+class _FakeDiskCache(dict):
+    """Stand-in for `diskcache.Cache`: one dict per directory, shared like the on-disk store."""
+
+    stores = {}
+
+    def __new__(cls, directory, size_limit=None):
+        return cls.stores.setdefault(directory, dict.__new__(cls))
+
+    def __init__(self, directory, size_limit=None):
+        pass
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+
+
+def test_disk_cache_is_shared_across_clients(monkeypatch, tmp_path):
+    import tavily_adapter
+
+    monkeypatch.setattr(tavily_adapter, "diskcache", type("dc", (), {"Cache": _FakeDiskCache}))
+    monkeypatch.setenv("TAVILY_DISK_CACHE", str(tmp_path))
+    first = TavilyClient()
+    first._set_cache("k", ["A"])
+
+    # a fresh client (e.g. the next CLI run) has an empty in-process cache but hits the disk
+    second = TavilyClient()
+    assert second._get_cached("k") == ["A"]
+    assert second.get_cache_metrics() == {"hits": 1, "misses": 0}
+    assert second._get_cached("other") is None
+
+
+def test_cache_key_is_fixed_size_and_normalized():
+    client = TavilyClient()
+    key = client._cache_key("  Quantum Computing ", 5)
+    assert key == client._cache_key("quantum computing", 5)
+    assert key != client._cache_key("quantum computing", 6)
+    assert len(client._cache_key("x" * 10_000, 5)) == len(key)
+    # memoized at module level, so every client shares the computed keys
+    import tavily_adapter
+
+    hits = tavily_adapter._cache_key_impl.cache_info().hits
+    assert TavilyClient()._cache_key("quantum computing", 5) == key
+    assert tavily_adapter._cache_key_impl.cache_info().hits == hits + 1
+
+
+def test_local_cache_entries_expire(monkeypatch):
+    import tavily_adapter
+
+    monkeypatch.setenv("TAVILY_LOCAL_CACHE_TTL", "60")
+    now = [1000.0]
+    monkeypatch.setattr(tavily_adapter.time, "monotonic", lambda: now[0])
+    client = TavilyClient()
+    client._set_cache("a", ["A"])
+    now[0] += 59
+    assert client._get_cached("a") == ["A"]
+    now[0] += 2
+    assert client._get_cached("a") is None
+    # the expired entry is dropped rather than left occupying an LRU slot
+    assert "a" not in client._cache
@@ -11,6 +11,10 @@ def test_inmemory_basic():
     m.append_to_list("L", 1)
     m.append_to_list("L", 2)
     assert m.get_list("L") == [1, 2]
+    assert list(m.iter_list("L")) == [1, 2]
+    m.append_many("L", [3, 4])
+    assert m.get_list("L") == [1, 2, 3, 4]
+    assert m.get_list("missing") == [] and list(m.iter_list("missing")) == []
 
 
 def test_make_memory_falls_back(monkeypatch):
@@ -28,6 +32,7 @@ def test_mock_llm():
 
 
 @pytest.mark.skipif(os.environ.get("GPT4O_API_KEY") is None and os.environ.get("OPENAI_API_KEY") is None, reason="openai creds missing")
+@pytest.mark.serial
 def test_gpt4o_adapter_smoke():
     adapter = GPT4oAdapter()
     resp = None
@@ -39,6 +44,7 @@ def test_gpt4o_adapter_smoke():
 
 
 @pytest.mark.skipif(os.environ.get("CLAUDE_API_KEY") is None, reason="claude creds missing")
+@pytest.mark.serial
 def test_claude_adapter_smoke():
     adapter = ClaudeAdapter()
     resp = None
@@ -47,3 +53,114 @@ def test_claude_adapter_smoke():
     except Exception as e:
         pytest.skip(f"Claude SDK call not available or failed: {e}")
     assert isinstance(resp, str)
+
+
+def test_gpt4o_adapter_reuses_client(monkeypatch):
+    import sys
+    import types
+
+    created = []
+
+    class FakeCompletions:
+        def create(self, **kwargs):
+            msg = types.SimpleNamespace(content="hi")
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg)])
+
+    class FakeOpenAI:
+        def __init__(self, api_key=None):
+            created.append(api_key)
+            self.chat = types.SimpleNamespace(completions=FakeCompletions())
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+    adapter = GPT4oAdapter(api_key="k")
+    assert adapter.generate("a") == "hi"
+    assert adapter.generate("b") == "hi"
+    assert created == ["k"]
+
+
+def test_async_gpt4o_adapter_builds_and_closes_a_client_per_loop(monkeypatch):
+    import asyncio
+    import sys
+    import types
+    from llm_adapters import AsyncGPT4oAdapter
+
+    clients = []
+
+    class FakeAsyncOpenAI:
+        def __init__(self, api_key=None):
+            self.closed = False
+            clients.append(self)
+
+            async def create(**kwargs):
+                msg = types.SimpleNamespace(content=f"hi from {id(asyncio.get_running_loop())}")
+                return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg)])
+
+            self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+
+        async def close(self):
+            self.closed = True
+
+    fake_openai = types.SimpleNamespace(OpenAI=lambda api_key=None: None, AsyncOpenAI=FakeAsyncOpenAI)
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    adapter = AsyncGPT4oAdapter(api_key="k")
+    assert clients == []  # nothing is bound to a loop until first use
+
+    async def twice():
+        return [await adapter.agenerate("a"), await adapter.agenerate("b")]
+
+    # no aclose: the client is still released when asyncio.run shuts its loop down
+    first = asyncio.run(twice())
+    assert first[0] == first[1] and len(clients) == 1 and clients[0].closed
+
+    async def once_then_close():
+        try:
+            return await adapter.agenerate("c")
+        finally:
+            await adapter.aclose()
+
+    asyncio.run(once_then_close())
+    assert len(clients) == 2 and clients[1].closed
+
+
+def test_caching_llm_hits_memory():
+    from llm_adapters import CachingLLM
+
+    calls = []
+
+    class CountingLLM:
+        def generate(self, prompt, **kwargs):
+            calls.append(prompt)
+            return f"out:{prompt}"
+
+    llm = CachingLLM(CountingLLM(), InMemoryMemory())
+    assert llm.generate("p", max_tokens=10) == "out:p"
+    assert llm.generate("p", max_tokens=10) == "out:p"
+    # a different max_tokens is a different cache entry
+    llm.generate("p", max_tokens=20)
+    assert calls == ["p", "p"]
+
+
+def test_caching_llm_entries_are_per_adapter():
+    from llm_adapters import CachingLLM
+
+    class FirstLLM:
+        def generate(self, prompt, **kwargs):
+            return "first"
+
+    class SecondLLM:
+        def generate(self, prompt, **kwargs):
+            return "second"
+
+    memory = InMemoryMemory()  # one shared backend, as with Redis
+    assert CachingLLM(FirstLLM(), memory).generate("p") == "first"
+    assert CachingLLM(SecondLLM(), memory).generate("p") == "second"
+    assert CachingLLM(FirstLLM(), memory).generate("p") == "first"
+
+
+def test_make_llm_wraps_when_cache_enabled(monkeypatch):
+    from llm_adapters import CachingLLM
+
+    monkeypatch.setenv("LLM_CACHE", "1")
+    llm = make_llm("mock")
+    assert isinstance(llm, CachingLLM)
+    assert "MOCK RESPONSE" in llm.generate("Hello")
@@ -1,5 +1,6 @@
 import tempfile
 import os
+import pytest
 from personal_researcher import PersonalResearcher
 from crewai_agents import Source
 
@@ -28,3 +29,69 @@ def test_personal_researcher_end_to_end(tmp_path):
     text = out.read_text()
     assert "executive summary" in text.lower() or "executive" in text.lower()
     assert "Key Verified Facts" in text
+
+
+class FakeAsyncLLM:
+    async def agenerate(self, prompt, **kwargs):
+        return "Async executive summary."
+
+    def generate(self, prompt, **kwargs):  # pragma: no cover - async path preferred
+        raise AssertionError("sync generate should not be used when agenerate exists")
+
+
+class RepeatingSearch:
+    def search(self, topic, limit=10):
+        snippet = f"A 2023 survey on {topic} found that most practitioners adopt hybrid techniques."
+        return [Source(title=t, url=f"u{t}", snippet=snippet) for t in ("A", "B")]
+
+
+def test_personal_researcher_run_async(tmp_path):
+    import asyncio
+
+    out = tmp_path / "pr_async.md"
+    agent = PersonalResearcher(search_tool=RepeatingSearch(), llm=FakeAsyncLLM(), output_path=str(out))
+    md = asyncio.run(agent.run_async("Test Topic"))
+    assert out.exists()
+    assert "Async executive summary." in md
+    assert "Key Verified Facts" in out.read_text()
+
+
+def test_run_team_no_cache_bypasses_llm_cache(monkeypatch, tmp_path):
+    import argparse
+    import asyncio
+    import agents_core
+    import llm_adapters
+    import run_team
+    from agents_core import InMemoryMemory
+
+    calls = []
+    monkeypatch.setattr(llm_adapters.MockLLMAdapter, "generate", lambda self, prompt, **kw: calls.append(prompt) or "summary")
+    memory = InMemoryMemory()  # shared across runs, as Redis would be
+    monkeypatch.setattr(agents_core, "make_memory", lambda backend="redis": memory)
+    monkeypatch.setenv("LLM_CACHE", "1")
+
+    def run(no_cache):
+        args = argparse.Namespace(
+            topic=["Quantum Computing"], topics_file=None, workers=1, output=str(tmp_path / "r.md"),
+            use_mock=True, agent="personal_researcher", llm="mock", memory="inmemory", no_cache=no_cache,
+        )
+        asyncio.run(run_team.amain(args))
+
+    run(no_cache=False)
+    run(no_cache=False)
+    assert len(calls) == 1  # second run served by CachingLLM
+    run(no_cache=True)
+    run(no_cache=True)
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize("workers", ["0", "-2"])
+def test_run_team_rejects_non_positive_workers(monkeypatch, capsys, workers):
+    import sys
+    import run_team
+
+    monkeypatch.setattr(sys, "argv", ["run_team.py", "--topic", "X", "--workers", workers])
+    with pytest.raises(SystemExit) as exc:
+        run_team.main()
+    assert exc.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
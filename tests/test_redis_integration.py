@@ -1,19 +1,15 @@
 import os
-import fakeredis
 import pytest
 
 from agents_core import RedisMemory
 
 
-def test_redis_memory_with_fakeredis(monkeypatch):
-    # monkeypatch redis.from_url to return fakeredis instance
+def test_redis_memory_with_fakeredis(monkeypatch, fake_redis_pool):
+    # monkeypatch the shared pool factory to hand out fakeredis connections
     import redis as real_redis
 
-    def fake_from_url(url, decode_responses=True):
-        return fakeredis.FakeRedis()
-
     monkeypatch.setattr("agents_core.redis", real_redis)
-    monkeypatch.setattr(real_redis, "from_url", fake_from_url)
+    monkeypatch.setattr("agents_core._get_pool", lambda url: fake_redis_pool)
 
     mem = RedisMemory(redis_url="redis://localhost:6379/0")
     mem.set("k", {"a": 1})
@@ -21,3 +17,57 @@ def test_redis_memory_with_fakeredis(monkeypatch):
     mem.append_to_list("L", 1)
     mem.append_to_list("L", 2)
     assert mem.get_list("L") == [1, 2]
+
+
+def test_redis_memory_append_many_single_round_trip(monkeypatch, fake_redis_pool):
+    import redis as real_redis
+
+    monkeypatch.setattr("agents_core.redis", real_redis)
+    monkeypatch.setattr("agents_core._get_pool", lambda url: fake_redis_pool)
+
+    mem = RedisMemory(redis_url="redis://localhost:6379/0")
+    fake = mem._client
+    calls = {"rpush": 0}
+    orig_rpush = fake.rpush
+
+    def counting_rpush(*a, **k):
+        calls["rpush"] += 1
+        return orig_rpush(*a, **k)
+
+    monkeypatch.setattr(fake, "rpush", counting_rpush)
+    mem.append_many("L", [1, {"a": 2}, "x"])
+    # values are queued on a pipeline, not sent with per-item client.rpush calls
+    assert calls["rpush"] == 0
+    assert mem.get_list("L") == [1, {"a": 2}, "x"]
+
+
+def test_redis_memory_batch_defers_writes_to_one_pipeline(monkeypatch, fake_redis_pool):
+    import redis as real_redis
+
+    monkeypatch.setattr("agents_core.redis", real_redis)
+    monkeypatch.setattr("agents_core._get_pool", lambda url: fake_redis_pool)
+
+    mem = RedisMemory(redis_url="redis://localhost:6379/0")
+    with mem.batch():
+        mem.append_to_list("L", 1)
+        mem.append_many("L", [2, 3])
+        mem.set("k", {"a": 1})
+        # nothing is sent until the outermost batch exits
+        assert mem.get_list("L") == []
+        assert mem.get("k") is None
+    assert mem.get_list("L") == [1, 2, 3]
+    assert mem.get("k") == {"a": 1}
+    # outside a batch writes go straight through again
+    mem.append_to_list("L", 4)
+    assert mem.get_list("L") == [1, 2, 3, 4]
+
+
+def test_redis_memory_instances_share_pool(monkeypatch):
+    import agents_core
+
+    monkeypatch.setattr(agents_core, "_POOLS", {})
+    m1 = RedisMemory(redis_url="redis://localhost:6379/5")
+    m2 = RedisMemory(redis_url="redis://localhost:6379/5")
+    m3 = RedisMemory(redis_url="redis://localhost:6379/6")
+    assert m1._client.connection_pool is m2._client.connection_pool
+    assert m1._client.connection_pool is not m3._client.connection_pool
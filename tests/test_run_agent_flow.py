@@ -1,5 +1,5 @@
 import os
-from agents_core import Agent, ToolRegistry, InMemoryMemory
+from agents_core import Agent, AsyncAgent, ToolRegistry, InMemoryMemory, ToolCall
 from llm_adapters import MockLLMAdapter
 
 
@@ -26,3 +26,81 @@ def test_agent_flow():
     res = agent.run_once({"topic":"X"})
     assert memory.get_list(agent.history_key)
     assert isinstance(res, list)
+
+
+class SlowEcho:
+    def run(self, value, delay=0.0):
+        import time
+        time.sleep(delay)
+        return value
+
+
+class FanOutAgent(Agent):
+    def plan(self, context):
+        return [
+            {"tool": "echo", "args": [1], "kwargs": {"delay": 0.05}},
+            {"tool": "echo", "args": [2]},
+            {"tool": "echo", "args": [3], "stop": True},
+            {"tool": "echo", "args": [4]},
+        ]
+
+
+def test_run_once_parallel_preserves_order_and_stops():
+    tools = ToolRegistry()
+    tools.register("echo", SlowEcho())
+    memory = InMemoryMemory()
+    agent = FanOutAgent("fanout", tools, memory=memory, max_workers=4)
+    res = agent.run_once({})
+    agent.close()
+    assert res == [1, 2, 3]
+    assert [o["result"] for o in memory.get_list(agent.history_key)] == [1, 2, 3]
+
+
+def test_run_once_sequential_when_limit_is_one(monkeypatch):
+    monkeypatch.setenv("TOOL_CONCURRENCY_LIMIT", "1")
+    tools = ToolRegistry()
+    tools.register("echo", SlowEcho())
+    agent = FanOutAgent("seq", tools)
+    assert agent._pool is None
+    assert agent.run_once({}) == [1, 2, 3]
+
+
+class ToolCallFanOut(Agent):
+    def plan(self, context):
+        return [ToolCall("echo", (1,), {"delay": 0.01}), {"tool": "echo", "args": [2]}, ToolCall("echo", (3,), stop=True), ToolCall("echo", (4,))]
+
+
+def test_run_once_accepts_tool_call_dataclasses():
+    tools = ToolRegistry()
+    tools.register("echo", SlowEcho())
+    agent = ToolCallFanOut("calls", tools, max_workers=2)
+    try:
+        assert agent.run_once({}) == [1, 2, 3]
+    finally:
+        agent.close()
+    assert not hasattr(ToolCall("echo"), "__dict__")
+    assert ToolCall("echo", (1,), {"k": 1}) == ToolCall("echo", (1,), {"k": 1})
+    assert ToolCall.__hash__ is None
+
+
+class AsyncEcho:
+    async def run(self, value):
+        return value
+
+
+class AsyncFanOut(AsyncAgent):
+    def plan(self, context):
+        return [{"tool": "sync", "args": [1]}, {"tool": "async", "args": [2]}]
+
+
+def test_async_agent_gathers_sync_and_async_tools():
+    import asyncio
+
+    tools = ToolRegistry()
+    tools.register("sync", SlowEcho())
+    tools.register("async", AsyncEcho())
+    memory = InMemoryMemory()
+    agent = AsyncFanOut("async", tools, memory=memory)
+    res = asyncio.run(agent.run_once_async({}))
+    assert res == [1, 2]
+    assert len(memory.get_list(agent.history_key)) == 2
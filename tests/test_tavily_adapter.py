@@ -1,3 +1,4 @@
+import json
 import os
 import types
 import pytest
@@ -5,92 +6,415 @@ import pytest
 from tavily_adapter import TavilyClient, TavilyError
 from crewai_agents import Source
 
+# default endpoint; `tavily_http` (conftest) intercepts requests to it
+SEARCH_URL = "https://api.tavily.ai/search"
 
-def test_missing_api_key_raises(monkeypatch):
-    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+
+@pytest.mark.parametrize("env_key", [None, ""], ids=["unset", "empty"])
+def test_missing_api_key_raises(monkeypatch, caplog, env_key):
+    if env_key is None:
+        monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    else:
+        monkeypatch.setenv("TAVILY_API_KEY", env_key)
     # TavilyClient now logs a warning instead of raising at init time
     # so we just verify it doesn't raise and logs a warning instead
     client = TavilyClient()
     assert client.api_key is None or client.api_key == ""
+    assert "TAVILY_API_KEY not set" in caplog.text
 
 
-def test_search_parses_http_response(monkeypatch):
-    # Provide an API key via env
-    monkeypatch.setenv("TAVILY_API_KEY", "testkey")
-
-    # fake requests.get
-    class FakeResponse:
-        status_code = 200
-
-        def raise_for_status(self):
-            return None
-
-        def json(self):
-            return {
-                "results": [
-                    {
-                        "title": "T1",
-                        "url": "https://ex.com/1",
-                        "snippet": "This is a test snippet about topic X.",
-                        "published": "2023-01-01",
-                    }
-                ]
-            }
-
-    def fake_get(url, headers=None, params=None, timeout=None):
-        assert headers and "Authorization" in headers
-        assert params and "q" in params
-        return FakeResponse()
-
-    # ensure we patch the session.get if present
-    monkeypatch.setattr("tavily_adapter.requests.get", fake_get)
+def test_search_parses_http_response(tavily_http, tavily_client):
+    tavily_http.get(
+        SEARCH_URL,
+        json={
+            "results": [
+                {
+                    "title": "T1",
+                    "url": "https://ex.com/1",
+                    "snippet": "This is a test snippet about topic X.",
+                    "published": "2023-01-01",
+                }
+            ]
+        },
+    )
 
-    client = TavilyClient()
-    results = client.search("topic X", limit=1)
+    results = tavily_client.search("topic X", limit=1)
     assert isinstance(results, list)
     assert len(results) == 1
     assert isinstance(results[0], Source)
     assert results[0].title == "T1"
+    request = tavily_http.calls[0].request
+    assert request.headers["Authorization"] == "Bearer testkey"
+    assert request.params["q"] == "topic X"
+
+
+def test_http_retry_and_cache(tavily_http, tavily_client):
+    import requests
+
+    # first call fails at the network level, the retry succeeds (registered responses fire in order)
+    tavily_http.get(SEARCH_URL, body=requests.ConnectionError("network hiccup"))
+    tavily_http.get(SEARCH_URL, json={"results": [{"title": "T2", "url": "u2", "snippet": "S"}]})
+
+    # first call will retry internally; after success results should be cached
+    r1 = tavily_client.search("topic Y", limit=1)
+    assert r1 and isinstance(r1[0], Source)
+    assert len(tavily_http.calls) == 2
+    # subsequent call should return cached results and not hit the network again
+    r2 = tavily_client.search("topic Y", limit=1)
+    assert r2 == r1
+    assert len(tavily_http.calls) == 2
+
+
+def test_http_requests_reuse_the_pooled_session(tavily_http, tavily_client, monkeypatch):
+    session = tavily_client._get_session()
+    calls = []
+    real_get = session.get
+    monkeypatch.setattr(session, "get", lambda *a, **k: calls.append(a) or real_get(*a, **k))
+    tavily_http.get(SEARCH_URL, json={"results": [{"title": "T", "url": "u", "snippet": "S"}]})
+    tavily_http.get(SEARCH_URL, json={"results": [{"title": "T", "url": "u", "snippet": "S"}]})
+
+    tavily_client.search("pooled topic 1", limit=1)
+    tavily_client.search("pooled topic 2", limit=1)
+    assert len(calls) == 2
+    assert tavily_client._get_session() is session
 
 
-def test_http_retry_and_cache(monkeypatch):
+@pytest.mark.parametrize(
+    "failure",
+    [ValueError("malformed request"), (401, "unauthorized")],
+    ids=["non-network-error", "4xx"],
+)
+def test_http_non_transient_failures_are_not_retried(tavily_http, tavily_client, failure):
+    if isinstance(failure, tuple):
+        tavily_http.get(SEARCH_URL, status=failure[0], body=failure[1])
+    else:
+        tavily_http.get(SEARCH_URL, body=failure)
+
+    with pytest.raises(TavilyError):
+        tavily_client.search("topic Z", limit=1)
+    assert len(tavily_http.calls) == 1
+
+
+def test_search_many_fans_out_per_topic(tavily_http, tavily_client):
+    def by_query(request):
+        q = request.params["q"]
+        return 200, {}, json.dumps({"results": [{"title": q, "url": f"https://ex.com/{q}", "snippet": "S"}]})
+
+    tavily_http.add_callback("GET", SEARCH_URL, callback=by_query)
+
+    out = tavily_client.search_many(["a", "b", "a"], limit=1)
+    assert list(out) == ["a", "b"]
+    assert out["b"][0].title == "b"
+    assert sorted(c.request.params["q"] for c in tavily_http.calls) == ["a", "b"]
+
+
+def test_asearch_uses_async_http_client_with_retry(monkeypatch):
+    import asyncio
+    import httpx
+
     monkeypatch.setenv("TAVILY_API_KEY", "testkey")
     calls = {"count": 0}
 
-    class FlakyResponse:
-        def __init__(self, succeed=False):
-            self.succeed = succeed
-            self.status_code = 200
+    def handler(request):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise httpx.ConnectError("network hiccup", request=request)
+        assert request.headers["Authorization"] == "Bearer testkey"
+        assert request.url.params["q"] == "topic A"
+        return httpx.Response(200, json={"results": [{"title": "TA", "url": "https://ex.com/a", "snippet": "S"}]})
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "tavily_adapter.httpx.AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+    client = TavilyClient(backoff_factor=0)
 
-        def raise_for_status(self):
-            if not self.succeed:
-                raise Exception("temporary failure")
+    async def go():
+        try:
+            first = await client.asearch("topic A", limit=1)
+            second = await client.asearch("topic A", limit=1)
+        finally:
+            await client.aclose()
+        return first, second
 
-        def json(self):
-            return {"results": [{"title": "T2", "url": "u2", "snippet": "S"}]}
+    first, second = asyncio.run(go())
+    assert first[0].title == "TA" and isinstance(first[0], Source)
+    assert second == first
+    # one failed attempt + one success; the second call is served from cache
+    assert calls["count"] == 2
 
-    def flaky_get(url, headers=None, params=None, timeout=None):
+
+def test_asearch_many_returns_topic_map(monkeypatch):
+    import asyncio
+    import httpx
+
+    monkeypatch.setenv("TAVILY_API_KEY", "testkey")
+
+    def handler(request):
+        q = request.url.params["q"]
+        return httpx.Response(200, json={"results": [{"title": q, "url": f"https://ex.com/{q}", "snippet": "S"}]})
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "tavily_adapter.httpx.AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    client = TavilyClient()
+
+    async def go():
+        try:
+            return await client.asearch_many(["x", "y", "x"], limit=1)
+        finally:
+            await client.aclose()
+
+    out = asyncio.run(go())
+    assert list(out) == ["x", "y"]
+    assert out["y"][0].title == "y"
+
+
+@pytest.mark.parametrize("gzipped", [False, True], ids=["identity", "gzip"])
+def test_search_iter_streams_and_caches(tavily_server, gzipped):
+    import gzip
+
+    pytest.importorskip("ijson")
+
+    body = json.dumps({"query": "q", "results": [{"title": f"T{i}", "url": f"https://ex.com/{i}", "snippet": "S", "score": 0.5} for i in range(3)]}).encode()
+    if gzipped:
+        # requests sends Accept-Encoding: gzip, so real responses usually arrive compressed
+        tavily_server.body, tavily_server.headers = gzip.compress(body), {"Content-Encoding": "gzip"}
+    else:
+        tavily_server.body = body
+    client = TavilyClient()
+    results = list(client.search_iter("topic S", limit=3))
+    assert [s.title for s in results] == ["T0", "T1", "T2"]
+    assert len(tavily_server.paths) == 1
+    # the completed stream populated the cache shared with `search`
+    assert client.search("topic S", limit=3) == results
+    assert len(tavily_server.paths) == 1
+
+
+def test_concurrent_asearch_calls_share_one_request(monkeypatch):
+    import asyncio
+    import httpx
+
+    monkeypatch.setenv("TAVILY_API_KEY", "testkey")
+    calls = {"count": 0}
+
+    async def handler(request):
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"results": [{"title": "TA", "url": "https://ex.com/a", "snippet": "S"}]})
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "tavily_adapter.httpx.AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    client = TavilyClient()
+
+    async def go():
+        try:
+            return await asyncio.gather(*(client.asearch("topic A", limit=1) for _ in range(5)))
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(go())
+    assert calls["count"] == 1
+    assert all(r == results[0] for r in results)
+    assert client._inflight == {}
+
+
+def test_asearch_honors_retry_after_on_429(monkeypatch):
+    import asyncio
+    import httpx
+
+    monkeypatch.setenv("TAVILY_API_KEY", "testkey")
+    calls = {"count": 0}
+    slept = []
+
+    def handler(request):
         calls["count"] += 1
-        # first call fails via exception, second succeeds
         if calls["count"] == 1:
-            raise Exception("network hiccup")
-        return FlakyResponse(succeed=True)
+            return httpx.Response(429, headers={"Retry-After": "0.25"})
+        return httpx.Response(200, json={"results": [{"title": "TA", "url": "https://ex.com/a", "snippet": "S"}]})
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "tavily_adapter.httpx.AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    real_sleep = asyncio.sleep
 
-    monkeypatch.setattr("tavily_adapter.requests.get", flaky_get)
+    async def fake_sleep(delay):
+        slept.append(delay)
+        await real_sleep(0)
 
+    monkeypatch.setattr("tavily_adapter.asyncio.sleep", fake_sleep)
     client = TavilyClient()
-    # first call will retry internally; after success results should be cached
-    r1 = client.search("topic Y", limit=1)
-    assert r1 and isinstance(r1[0], Source)
-    # subsequent call should return cached results and not hit requests.get again
-    calls["count"] = 0
-    # monkeypatch requests.get to increment calls if invoked; since we want to ensure cached path
-    def detect_get(*args, **kwargs):
-        calls["count"] += 1
-        return FlakyResponse(succeed=True)
 
-    monkeypatch.setattr("tavily_adapter.requests.get", detect_get)
-    r2 = client.search("topic Y", limit=1)
-    # if cached, detect_get should not have been called
-    assert calls["count"] == 0
+    async def go():
+        try:
+            return await client.asearch("topic A", limit=1)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(go())[0].title == "TA"
+    assert calls["count"] == 2
+    assert slept == [0.25]
+    # jittered backoff stays within the exponential envelope
+    assert all(0 <= client._backoff(2) <= client.backoff_factor * 4 for _ in range(20))
+
+
+def test_long_retry_after_fails_fast_instead_of_sleeping(tavily_http, monkeypatch):
+    import asyncio
+    import httpx
+    import tavily_adapter
+
+    slept = []
+    monkeypatch.setattr(tavily_adapter.time, "sleep", slept.append)
+    tavily_http.get(SEARCH_URL, status=429, headers={"Retry-After": "3600"})
+    client = TavilyClient()
+    with pytest.raises(TavilyError, match="Retry-After"):
+        client.search("topic R", limit=1)
+    assert len(tavily_http.calls) == 1 and slept == []
+
+    async def fake_sleep(delay):  # pragma: no cover - must not be reached
+        slept.append(delay)
+
+    monkeypatch.setattr("tavily_adapter.asyncio.sleep", fake_sleep)
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "tavily_adapter.httpx.AsyncClient",
+        lambda **kwargs: real_async_client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "3600"})), **kwargs
+        ),
+    )
+
+    async def go():
+        try:
+            return await client.asearch("topic R", limit=1)
+        finally:
+            await client.aclose()
+
+    with pytest.raises(TavilyError, match="Retry-After"):
+        asyncio.run(go())
+    assert slept == []
+
+
+def test_async_client_is_closed_per_loop_and_errors_become_tavily_errors(monkeypatch):
+    import asyncio
+    import httpx
+
+    monkeypatch.setenv("TAVILY_API_KEY", "testkey")
+    clients = []
+
+    def handler(request):
+        if request.url.params["q"] == "broken":
+            raise httpx.DecodingError("bad gzip", request=request)
+        return httpx.Response(200, json={"results": [{"title": "TA", "url": "https://ex.com/a", "snippet": "S"}]})
+
+    real_async_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        clients.append(real_async_client(transport=httpx.MockTransport(handler), **kwargs))
+        return clients[-1]
+
+    monkeypatch.setattr("tavily_adapter.httpx.AsyncClient", make_client)
+    client = TavilyClient()
+
+    # never awaits aclose: the client is still closed when asyncio.run shuts the loop down
+    assert asyncio.run(client.asearch("topic A", limit=1))[0].title == "TA"
+    assert clients[0].is_closed
+
+    async def broken():
+        try:
+            return await client.asearch("broken", limit=1)
+        finally:
+            await client.aclose()
+
+    with pytest.raises(TavilyError):
+        asyncio.run(broken())
+    assert len(clients) == 2 and clients[1].is_closed
+    assert client._breaker._failures == 1
+
+
+def test_parsed_sources_are_slotted_and_frozen():
+    import dataclasses
+
+    src = TavilyClient._parse_results([{"title": "T", "url": "u", "snippet": "S", "score": 1}])[0]
+    assert not hasattr(src, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        src.title = "other"
+    assert src.metadata == {"title": "T", "url": "u", "snippet": "S", "score": 1}
+
+
+def test_sdk_dict_response_is_unwrapped_and_bad_payloads_fall_back(tavily_http):
+    class FakeSDK:
+        def __init__(self, resp):
+            self.resp = resp
+
+        def search(self, topic, limit=10):
+            return self.resp
+
+    client = TavilyClient()
+    client._use_sdk = True
+    client._client = FakeSDK({"query": "q", "results": [{"title": "SDK", "url": "https://ex.com/s", "snippet": "S"}]})
+    assert [s.title for s in client.search("topic D", limit=1)] == ["SDK"]
+    assert len(tavily_http.calls) == 0
+
+    # a payload without a results list is not parsed (and cached) as empty; HTTP is tried instead
+    tavily_http.get(SEARCH_URL, json={"results": [{"title": "HTTP", "url": "https://ex.com/h", "snippet": "S"}]})
+    client._client = FakeSDK({"answer": "no rows"})
+    assert [s.title for s in client.search("topic E", limit=1)] == ["HTTP"]
+    with pytest.raises(TavilyError):
+        client._parse({"results": []})
+    with pytest.raises(TavilyError):
+        TavilyClient._parse_results({"results": []})
+
+
+def test_parsed_urls_are_interned():
+    import tavily_adapter
+
+    rows = [{"title": "T", "url": "".join(["https://ex.com/", "a"]), "snippet": "S"}]
+    generic = TavilyClient._parse_results(rows)[0]
+    fast = TavilyClient()._parse([{"title": "T", "url": "".join(["https://ex.com/", "a"]), "snippet": "S"}])[0]
+    cached = tavily_adapter._decode_results(tavily_adapter._encode_results([generic]))[0]
+    assert generic.url is fast.url is cached.url
+
+
+def test_parser_specializes_to_first_response_schema():
+    client = TavilyClient()
+    first = client._parse([{"headline": "H", "link": "https://ex.com/1", "summary": "S"}])
+    assert first == TavilyClient._parse_results([{"headline": "H", "link": "https://ex.com/1", "summary": "S"}])
+    assert client._parse_fast is not None
+    # rows deviating from the observed schema still parse via the generic key scan
+    rows = [{"headline": "H2", "url": "https://ex.com/2"}, {"title": "T3", "link": "https://ex.com/3", "summary": "S3", "date": "2024"}, "junk"]
+    assert client._parse(rows) == TavilyClient._parse_results(rows)
+
+
+def test_circuit_breaker_fails_fast_after_consecutive_failures(tavily_http, monkeypatch):
+    import requests
+    import tavily_adapter
+
+    monkeypatch.setenv("TAVILY_BREAKER_FAIL_MAX", "2")
+    now = [1000.0]
+    monkeypatch.setattr(tavily_adapter.time, "monotonic", lambda: now[0])
+    tavily_http.get(SEARCH_URL, body=requests.ConnectionError("down"))
+    client = TavilyClient(max_retries=0, backoff_factor=0)
+
+    for topic in ("a", "b"):
+        with pytest.raises(TavilyError):
+            client.search(topic, limit=1)
+    assert len(tavily_http.calls) == 2
+    # open: the third search fails without touching the network
+    with pytest.raises(tavily_adapter.CircuitOpenError):
+        client.search("c", limit=1)
+    assert len(tavily_http.calls) == 2
 
+    # after the reset timeout one trial request goes through and its success closes the circuit
+    now[0] += 31
+    tavily_http.replace("GET", SEARCH_URL, json={"results": [{"title": "T", "url": "u", "snippet": "S"}]})
+    assert client.search("d", limit=1)[0].title == "T"
+    assert client.search("e", limit=1)[0].title == "T"
@@ -1,43 +1,70 @@
-import fakeredis
 import json
-from tavily_adapter import TavilyClient
-
-
-def test_tavily_redis_shared_cache(monkeypatch):
-    # create a fake redis client and patch tavily_adapter.redis.from_url
-    fake_redis = fakeredis.FakeRedis()
-
-    class FakeRedisModule:
-        @staticmethod
-        def from_url(url, decode_responses=True):
-            return fake_redis
-
-    monkeypatch.setattr("tavily_adapter.redis", FakeRedisModule)
+import pytest
 
-    calls = {"count": 0}
+import tavily_adapter
+from tavily_adapter import TavilyClient
 
-    class FakeResponse:
-        status_code = 200
+SEARCH_URL = "https://api.tavily.ai/search"
 
-        def json(self):
-            return {"results": [{"title": "T1", "url": "u1", "snippet": "S"}]}
 
-    def fake_get(url, headers=None, params=None, timeout=None):
-        calls["count"] += 1
-        return FakeResponse()
+def test_tavily_redis_shared_cache(monkeypatch, tavily_http, fake_redis):
+    # hand the shared fake redis client out from the shared-pool client factory
+    monkeypatch.setattr("tavily_adapter._redis_client", lambda url: fake_redis)
 
-    monkeypatch.setattr("tavily_adapter.requests.get", fake_get)
+    tavily_http.get(SEARCH_URL, json={"results": [{"title": "T1", "url": "u1", "snippet": "S"}]})
 
     client = TavilyClient(redis_cache_url="redis://localhost:6379/0")
     # first call should hit HTTP
     r1 = client.search("topic Z", limit=1)
-    assert calls["count"] == 1
+    assert len(tavily_http.calls) == 1
     # second call should be served from redis cache (no new HTTP call)
     r2 = client.search("topic Z", limit=1)
-    assert calls["count"] == 1
+    assert len(tavily_http.calls) == 1
     # verify cached payload stored in redis
     cache_key = client._cache_key("topic Z", 1)
     cached = fake_redis.get(cache_key)
     assert cached is not None
-    payload = json.loads(cached)
-    assert isinstance(payload, list)
+    assert tavily_adapter._decode_results(cached) == r1
+
+
+def test_cache_codec_round_trips_sources(monkeypatch):
+    from crewai_agents import Source
+
+    monkeypatch.setattr(tavily_adapter, "msgpack", None)
+    src = Source(title="T", url="u", snippet="S", published="2023-01-01", metadata={"rank": 1})
+    for codec in (tavily_adapter.orjson, None):
+        monkeypatch.setattr(tavily_adapter, "orjson", codec)
+        raw = tavily_adapter._encode_results([src, {"other": 1}])
+        assert isinstance(raw, bytes)
+        assert tavily_adapter._decode_results(raw) == [src, {"other": 1}]
+
+
+def test_msgpack_zstd_codec_is_versioned_and_reads_json_entries():
+    pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+    from crewai_agents import Source
+
+    src = Source(title="T", url="u", snippet="long snippet " * 50, metadata={"rank": 1})
+    raw = tavily_adapter._encode_results([src])
+    assert raw[0] == tavily_adapter._CODEC_MSGPACK_ZSTD
+    assert len(raw) < len(json.dumps([{"title": "T", "url": "u", "snippet": src.snippet}]))
+    assert tavily_adapter._decode_results(raw) == [src]
+    # untagged JSON entries (older writers, or processes without msgpack/zstd) still decode
+    assert tavily_adapter._decode_results(json.dumps([{"title": "T", "url": "u", "snippet": "S"}]).encode())[0].title == "T"
+
+
+def test_search_many_pipelines_cache_lookups(monkeypatch, tavily_http, fake_redis):
+    monkeypatch.setattr("tavily_adapter._redis_client", lambda url: fake_redis)
+
+    def by_query(request):
+        q = request.params["q"]
+        return 200, {}, json.dumps({"results": [{"title": q, "url": f"u-{q}", "snippet": "S"}]})
+
+    tavily_http.add_callback("GET", SEARCH_URL, callback=by_query)
+
+    client = TavilyClient(redis_cache_url="redis://localhost:6379/0")
+    client.search("a", limit=1)
+    out = client.search_many(["a", "b"], limit=1)
+    assert [c.request.params["q"] for c in tavily_http.calls] == ["a", "b"]
+    assert out["a"][0].title == "a" and out["b"][0].title == "b"
+    assert client.get_cache_metrics() == {"hits": 1, "misses": 2}
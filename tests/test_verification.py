@@ -20,3 +20,125 @@ def test_no_merge_when_different():
     analyst = SeniorResearchAnalyst(search_tool=None)
     v = analyst.verify_facts([s1, s2], min_support=2)
     assert len(v) == 0
+
+
+def test_verify_facts_cached_in_memory(monkeypatch):
+    from agents_core import InMemoryMemory
+
+    s1 = Source(title="A", url="u1", snippet="A 2023 survey on topic found that 70% of practitioners adopt hybrid techniques.")
+    s2 = Source(title="B", url="u2", snippet="A 2023 survey on topic found that 70 of practitioners adopt hybrid techniques.")
+    memory = InMemoryMemory()
+    analyst = SeniorResearchAnalyst(search_tool=None, memory=memory)
+    first = analyst.verify_facts([s1, s2], min_support=2)
+
+    # a cache hit must not recompute
+    monkeypatch.setattr(analyst, "_verify_facts", lambda *a, **k: (_ for _ in ()).throw(AssertionError("recomputed")))
+    second = analyst.verify_facts([s1, s2], min_support=2)
+    assert [vf.claim for vf in second] == [vf.claim for vf in first]
+    assert isinstance(second[0].supporting_sources[0], Source)
+    assert [s.url for s in second[0].supporting_sources] == ["u1", "u2"]
+
+
+def test_verify_cache_key_covers_title_published_and_ner_backend(monkeypatch):
+    import crewai_agents_helpers
+
+    key = SeniorResearchAnalyst._verify_cache_key
+    s = Source(title="A", url="u1", snippet="snippet", published="2024-01-01")
+    base, plain = key([s], 2, 80, True), key([s], 2, 80, False)
+    assert key([Source(title="A2", url="u1", snippet="snippet", published="2024-01-01")], 2, 80, True) != base
+    assert key([Source(title="A", url="u1", snippet="snippet", published="2025-01-01")], 2, 80, True) != base
+    monkeypatch.setattr(crewai_agents_helpers, "ner_backend_tag", lambda: "spacy:en_other-9.9")
+    assert key([s], 2, 80, True) != base
+    # the NER backend only matters when NER is part of the verification
+    assert key([s], 2, 80, False) == plain
+
+
+def test_cluster_claims_greedy_first_match():
+    claims = [
+        "a 2023 survey on topic found that 70 of practitioners adopt hybrid techniques.",
+        "method x outperforms method y on benchmarks across many datasets.",
+        "a 2023 survey on topic found that 70 of the practitioners adopt hybrid techniques.",
+    ]
+    clusters = SeniorResearchAnalyst._cluster_claims(claims, 80)
+    assert clusters == [[claims[0], claims[2]], [claims[1]]]
+
+
+def test_greedy_label_kernels_agree():
+    np = __import__("pytest").importorskip("numpy")
+    import crewai_agents
+
+    rng = np.random.default_rng(0)
+    scores = rng.uniform(0, 100, (60, 60)).astype(np.float32)
+    scores = (scores + scores.T) / 2
+    expected = crewai_agents._greedy_labels_np(scores, 80.0)
+    assert (crewai_agents._greedy_labels(scores, 80.0) == expected).all()
+    assert (crewai_agents._greedy_labels_loop(scores, 80.0) == expected).all()
+    jit = crewai_agents._get_jit_labels()
+    if jit is not None:
+        assert (jit(scores, 80.0) == expected).all()
+
+
+def test_greedy_labels_skip_jit_below_threshold(monkeypatch):
+    np = __import__("pytest").importorskip("numpy")
+    import crewai_agents
+
+    def no_jit():
+        raise AssertionError("numba kernel loaded for a small input")
+
+    monkeypatch.setattr(crewai_agents, "_get_jit_labels", no_jit)
+    scores = np.full((crewai_agents._JIT_MIN_CLAIMS - 1,) * 2, 100.0, dtype=np.float32)
+    assert (crewai_agents._greedy_labels(scores, 80.0) == 0).all()
+
+
+def test_lsh_bucketed_clustering_matches_dense(monkeypatch):
+    import random
+    import pytest
+    import crewai_agents
+
+    if not crewai_agents._HAVE_FUZZ or crewai_agents.np is None:
+        pytest.skip("rapidfuzz/numpy not installed")
+    rng = random.Random(1)
+    # a large random vocabulary: "w{i}"-style tokens share most 3-grams and land in one LSH bucket
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randrange(3, 9))) for _ in range(3000)]
+    claims = []
+    for _ in range(60):
+        base = [rng.choice(words) for _ in range(12)]
+        claims.append(" ".join(base))
+        base[rng.randrange(len(base))] = "tweak"
+        claims.append(" ".join(base))
+    claims = list(dict.fromkeys(claims))
+
+    dense = SeniorResearchAnalyst._cluster_claims(claims, 80)
+    monkeypatch.setattr(crewai_agents, "_LSH_MIN_CLAIMS", 0)
+    assert SeniorResearchAnalyst._cluster_claims(claims, 80) == dense
+    assert len(crewai_agents._lsh_components(claims)) > 1
+
+
+def test_lsh_path_matches_dense_on_large_input_with_permuted_duplicates(monkeypatch):
+    import random
+    import string
+    import pytest
+    import crewai_agents
+
+    if not crewai_agents._HAVE_FUZZ or crewai_agents.np is None:
+        pytest.skip("rapidfuzz/numpy not installed")
+    rng = random.Random(7)
+    vocab = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randrange(3, 9))) for _ in range(3000)]
+    claims = []
+    for n in range(300):
+        words = [rng.choice(vocab) for _ in range(rng.randrange(8, 16))]
+        claims.append(" ".join(words))
+        variant = words[:]
+        if n % 2:
+            # word-permuted duplicate: token_sort_ratio sees it as (near) identical
+            rng.shuffle(variant)
+        variant[rng.randrange(len(variant))] += "x"
+        claims.append(" ".join(variant).capitalize())
+    claims = list(dict.fromkeys(claims))
+    assert len(claims) > crewai_agents._LSH_MIN_CLAIMS
+
+    lsh = SeniorResearchAnalyst._cluster_claims(claims, 80)
+    monkeypatch.setattr(crewai_agents, "_LSH_MIN_CLAIMS", 10**9)
+    dense = SeniorResearchAnalyst._cluster_claims(claims, 80)
+    assert sum(len(c) > 1 for c in dense) >= 290
+    assert lsh == dense
@@ -40,3 +40,93 @@ def test_ner_prevents_merge_when_no_shared_entity(monkeypatch):
     analyst = SeniorResearchAnalyst(search_tool=None)
     verified = analyst.verify_facts([s1, s2], min_support=2, ner_required=True)
     assert len(verified) == 0
+
+
+def test_extract_entities_batch_matches_single(monkeypatch):
+    import crewai_agents_helpers
+
+    monkeypatch.setattr(crewai_agents_helpers, "_nlp", None)
+    texts = ["Quantum Computing at Google", "", "Quantum Computing at Google", "Nothing here"]
+    batch = crewai_agents_helpers.extract_entities_batch(texts)
+    assert batch == [frozenset(crewai_agents_helpers.extract_entities(t)) for t in texts]
+    # the public helper hands out a fresh mutable set, leaving the cached value intact
+    ents = crewai_agents_helpers.extract_entities(texts[0])
+    ents.add("mutated")
+    assert "mutated" not in crewai_agents_helpers.extract_entities(texts[0])
+
+
+def test_extract_entities_batch_uses_worker_processes_for_large_batches(monkeypatch):
+    import types
+    import crewai_agents_helpers
+
+    calls = []
+
+    class FakeNLP:
+        def pipe(self, texts, batch_size, n_process):
+            calls.append(n_process)
+            for t in texts:
+                yield types.SimpleNamespace(ents=[types.SimpleNamespace(text=t.split()[0])])
+
+    monkeypatch.setattr(crewai_agents_helpers, "_nlp", FakeNLP())
+    monkeypatch.setattr(crewai_agents_helpers, "_PIPE_N_PROCESS", 2)
+    monkeypatch.setattr(crewai_agents_helpers, "_PIPE_MP_MIN_TEXTS", 3)
+
+    assert crewai_agents_helpers.extract_entities_batch(["Alpha x", "Beta y"]) == [frozenset({"alpha"}), frozenset({"beta"})]
+    assert crewai_agents_helpers.extract_entities_batch(["Gamma z", "Delta w", "Epsilon v", ""])[-1] == frozenset()
+    assert calls == [1, 2]
+
+
+def test_batch_defers_to_patched_extract_entities_and_cache_tracks_model(monkeypatch):
+    import types
+    import crewai_agents_helpers
+
+    class FakeNLP:
+        def __init__(self, label):
+            self.label = label
+
+        def __call__(self, text):
+            return types.SimpleNamespace(ents=[types.SimpleNamespace(text=self.label)])
+
+        def pipe(self, texts, batch_size, n_process):  # pragma: no cover - must not be used here
+            raise AssertionError("patched extract_entities should bypass nlp.pipe")
+
+    # a model is loaded, yet the monkeypatched per-text shim still decides the entities
+    monkeypatch.setattr(crewai_agents_helpers, "_nlp", FakeNLP("first"))
+    monkeypatch.setattr(crewai_agents_helpers, "extract_entities", fake_nlp_entities_mapping)
+    assert crewai_agents_helpers.extract_entities_batch(["Quantum computing now"]) == [frozenset({"quantum computing"})]
+    monkeypatch.undo()
+
+    text = "Entities for a swapped model"
+    monkeypatch.setattr(crewai_agents_helpers, "_nlp", FakeNLP("first"))
+    assert crewai_agents_helpers.extract_entities(text) == {"first"}
+    monkeypatch.setattr(crewai_agents_helpers, "_nlp", FakeNLP("second"))
+    assert crewai_agents_helpers.extract_entities(text) == {"second"}
+
+
+def test_batch_and_single_extraction_share_the_entity_cache(monkeypatch):
+    import types
+    import crewai_agents_helpers
+
+    piped = []
+
+    class FakeNLP:
+        def __call__(self, text):
+            return types.SimpleNamespace(ents=[types.SimpleNamespace(text="single")])
+
+        def pipe(self, texts, batch_size, n_process):
+            piped.append(list(texts))
+            for t in texts:
+                yield types.SimpleNamespace(ents=[types.SimpleNamespace(text="batched")])
+
+    monkeypatch.setattr(crewai_agents_helpers, "_nlp", FakeNLP())
+    # a text already extracted one at a time is served from the cache, not re-run through the pipe
+    assert crewai_agents_helpers.extract_entities("Seen before") == {"single"}
+    assert crewai_agents_helpers.extract_entities_batch(["Seen before", "New text"]) == [
+        frozenset({"single"}),
+        frozenset({"batched"}),
+    ]
+    assert piped == [["New text"]]
+    # and the batch results are cached for later calls of either kind
+    assert crewai_agents_helpers.extract_entities("New text") == {"batched"}
+    assert crewai_agents_helpers.extract_entities_batch(["New text", "Seen before"])[0] == frozenset({"batched"})
+    assert piped == [["New text"]]
@@ -0,0 +1,77 @@
+import types
+
+import pytest
+
+pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st
+
+import crewai_agents
+import crewai_agents_helpers
+from crewai_agents import SeniorResearchAnalyst, Source
+
+# near-duplicate snippets: a few base sentences with small random suffixes, so clusters form
+_BASES = [
+    "A 2023 survey found that 70% of practitioners adopt hybrid techniques",
+    "Quantum error correction remains the main obstacle to scaling hardware",
+    "Transformer models dominate benchmarks in natural language processing",
+]
+_snippets = st.lists(
+    st.builds(lambda base, tail: f"{_BASES[base]} {tail}.", st.integers(0, len(_BASES) - 1), st.text(max_size=20)),
+    min_size=2,
+    max_size=50,
+)
+
+
+def _counted_verify(snippets):
+    """Run verify_facts (with NER) while counting the expensive operations, and assert they stay
+    bounded: at most one similarity matrix and no per-pair scorer calls on the dense path, and one
+    batched NER pass over at most the distinct snippets. Re-introducing pairwise scoring or
+    per-candidate NER breaks these counts regardless of machine speed."""
+    calls = {"cdist": 0, "pair_scores": 0, "ner_batches": 0, "ner_texts": 0}
+    real_cdist = crewai_agents.process.cdist if crewai_agents._HAVE_FUZZ else None
+    real_scorer = crewai_agents.fuzz.token_sort_ratio if crewai_agents._HAVE_FUZZ else None
+    real_batch = crewai_agents_helpers.extract_entities_batch
+
+    def cdist(a, b, scorer=None, **kwargs):
+        calls["cdist"] += 1
+        # hand rapidfuzz the native scorer so the matrix itself is not counted pair by pair
+        return real_cdist(a, b, scorer=real_scorer, **kwargs)
+
+    def pair_score(*args, **kwargs):
+        calls["pair_scores"] += 1
+        return real_scorer(*args, **kwargs)
+
+    def batch(texts):
+        calls["ner_batches"] += 1
+        calls["ner_texts"] += len(texts)
+        return real_batch(texts)
+
+    srcs = [Source(title=str(i), url=f"u{i}", snippet=s) for i, s in enumerate(snippets)]
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(crewai_agents_helpers, "extract_entities_batch", batch)
+        if crewai_agents._HAVE_FUZZ:
+            mp.setattr(crewai_agents, "process", types.SimpleNamespace(cdist=cdist))
+            mp.setattr(crewai_agents, "fuzz", types.SimpleNamespace(token_sort_ratio=pair_score))
+        verified = SeniorResearchAnalyst(search_tool=None).verify_facts(srcs, min_support=2, ner_required=True)
+
+    if crewai_agents._HAVE_FUZZ and crewai_agents.np is not None:
+        assert calls["cdist"] <= 1
+        assert calls["pair_scores"] == 0
+    assert calls["ner_batches"] <= 1
+    assert calls["ner_texts"] <= len(set(snippets))
+    return verified
+
+
+@settings(deadline=None, max_examples=25)
+@given(st.lists(st.text(min_size=20, max_size=200), min_size=2, max_size=50))
+def test_verify_facts_work_is_bounded_on_arbitrary_text(snippets):
+    _counted_verify(snippets)
+
+
+@settings(deadline=None, max_examples=25)
+@given(_snippets)
+def test_verified_facts_have_distinct_supporting_sources(snippets):
+    for vf in _counted_verify(snippets):
+        urls = [s.url for s in vf.supporting_sources]
+        assert len(urls) >= 2
+        assert len(set(urls)) == len(urls)